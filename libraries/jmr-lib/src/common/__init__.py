@@ -1,12 +1,29 @@
 """Common utilities and decorators for resilient service communication."""
 
 from .retry import with_retry
-from .circuit_breaker import with_circuit_breaker, CircuitBreaker, CircuitBreakerError, CircuitState
+from .circuit_breaker import with_circuit_breaker, get_circuit_breaker, get_breaker_for_host, CircuitBreaker, CircuitBreakerError, CircuitState
+from .resilient import resilient
+from .bulkhead import Bulkhead, BulkheadRejectedError
+from .batch_loader import BatchLoader
+from .correlation import new_correlation_id, current_correlation_id
+from .clock import fast_utc_iso, fast_utc_date_iso
+from .serialization import dumps_json
 
 __all__ = [
     'with_retry',
     'with_circuit_breaker',
+    'resilient',
+    'get_circuit_breaker',
+    'get_breaker_for_host',
     'CircuitBreaker',
     'CircuitBreakerError',
-    'CircuitState'
+    'CircuitState',
+    'Bulkhead',
+    'BulkheadRejectedError',
+    'BatchLoader',
+    'new_correlation_id',
+    'current_correlation_id',
+    'fast_utc_iso',
+    'fast_utc_date_iso',
+    'dumps_json'
 ]
@@ -0,0 +1,76 @@
+"""DataLoader-style coalescing of concurrent lookups into batched queries."""
+import asyncio
+from typing import Awaitable, Callable, Dict, Generic, Hashable, List, Optional, Set, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class BatchLoader(Generic[K, V]):
+    """
+    Coalesce concurrent loads into one batched call.
+    
+    Keys requested within the batching window are collected and resolved by a single
+    call to batch_fn; concurrent requests for the same key share one result. With the
+    default window of 0 the batch is flushed on the next loop tick, so a lone load adds
+    no delay while loads issued together (e.g. via asyncio.gather) still share a call.
+    The loader binds its futures to the event loop that runs it, so create one per loop.
+    """
+    
+    def __init__(self, batch_fn: Callable[[List[K]], Awaitable[Dict[K, V]]], window: float = 0.0):
+        """
+        Initialize the batch loader.
+        
+        Args:
+            batch_fn: Coroutine resolving a list of keys to a {key: value} mapping; missing keys load as None
+            window: Seconds to collect keys before issuing the batch (0 flushes on the next loop tick)
+        """
+        self._batch_fn = batch_fn
+        self._window = window
+        self._pending: Dict[K, asyncio.Future] = {}
+        # Strong references keep in-flight flush tasks from being garbage collected
+        self._tasks: Set[asyncio.Task] = set()
+    
+    async def load(self, key: K) -> Optional[V]:
+        """
+        Load a single key as part of the current batch.
+        
+        Args:
+            key: Key to resolve
+            
+        Returns:
+            The value returned by batch_fn for key, or None if it was not found
+        """
+        future = self._pending.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._pending[key] = future
+            if len(self._pending) == 1:
+                if self._window > 0:
+                    loop.call_later(self._window, self._dispatch)
+                else:
+                    loop.call_soon(self._dispatch)
+        # Shield so one cancelled caller does not cancel the result shared with others
+        return await asyncio.shield(future)
+    
+    def _dispatch(self):
+        """Hand the collected keys to a flush task and start a new batch."""
+        pending, self._pending = self._pending, {}
+        task = asyncio.get_running_loop().create_task(self._flush(pending))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+    
+    async def _flush(self, pending: Dict[K, asyncio.Future]):
+        """Resolve every pending future from one batch_fn call."""
+        try:
+            results = await self._batch_fn(list(pending))
+        except Exception as e:
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        for key, future in pending.items():
+            if not future.done():
+                future.set_result(results.get(key))
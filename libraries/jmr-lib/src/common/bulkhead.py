@@ -0,0 +1,57 @@
+"""Bulkhead pattern implementation for bounding concurrent calls to a dependency."""
+import asyncio
+from typing import Optional
+
+
+class BulkheadRejectedError(Exception):
+    """Raised when no bulkhead slot becomes available in time."""
+    pass
+
+
+class Bulkhead:
+    """
+    Bounds the number of concurrent calls to a dependency.
+    
+    Callers beyond the capacity wait for a free slot; if none frees up within the
+    acquire timeout the call is rejected, isolating the rest of the service from a
+    slow dependency. Rejections are not HTTP failures, so circuit breakers built with
+    the default expected exceptions do not count them.
+    
+    Usage:
+        bulkhead = Bulkhead(capacity=50, acquire_timeout=5.0, name="UMR")
+        async with bulkhead:
+            ...
+    """
+    
+    __slots__ = ('capacity', 'acquire_timeout', 'name', '_semaphore')
+    
+    def __init__(self, capacity: int, acquire_timeout: Optional[float] = None, name: Optional[str] = None):
+        """
+        Initialize bulkhead.
+        
+        Args:
+            capacity: Maximum number of concurrent calls
+            acquire_timeout: Seconds to wait for a free slot (None waits indefinitely)
+            name: Optional name for error messages
+        """
+        self.capacity = capacity
+        self.acquire_timeout = acquire_timeout
+        self.name = name or "Bulkhead"
+        self._semaphore = asyncio.Semaphore(capacity)
+    
+    async def __aenter__(self) -> "Bulkhead":
+        # Free slot or unbounded wait: acquire without the wait_for task overhead
+        if self.acquire_timeout is None or not self._semaphore.locked():
+            await self._semaphore.acquire()
+            return self
+        
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), self.acquire_timeout)
+        except asyncio.TimeoutError:
+            raise BulkheadRejectedError(
+                f"{self.name}: all {self.capacity} slots busy for {self.acquire_timeout}s"
+            ) from None
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        self._semaphore.release()
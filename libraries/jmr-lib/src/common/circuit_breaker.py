@@ -1,14 +1,20 @@
 """Circuit breaker pattern implementation for handling service failures."""
-import asyncio
+import threading
+import time
 from functools import wraps
-from typing import Callable, Any, Optional
+from typing import Callable, Any, Dict, Optional
 from datetime import datetime, timedelta
 from enum import Enum
 from utility import logprovider
+from .retry import _WRAPPER_ASSIGNMENTS, _collapse_exceptions
 import httpx
 
 logger = logprovider.get_logger()
 
+# Circuit breakers shared by name across decorations
+_REGISTRY: Dict[str, "CircuitBreaker"] = {}
+_REGISTRY_LOCK = threading.Lock()
+
 
 class CircuitState(Enum):
     """Circuit breaker states."""
@@ -17,6 +23,12 @@ class CircuitState(Enum):
     HALF_OPEN = "half_open"  # Testing if service recovered
 
 
+# Module-level aliases avoid enum attribute lookups on the hot path
+_CLOSED = CircuitState.CLOSED
+_OPEN = CircuitState.OPEN
+_HALF_OPEN = CircuitState.HALF_OPEN
+
+
 class CircuitBreakerError(Exception):
     """Raised when circuit breaker is open."""
     pass
@@ -32,6 +44,18 @@ class CircuitBreaker:
     - HALF_OPEN: Testing if service recovered, limited requests allowed
     """
     
+    __slots__ = (
+        'failure_threshold',
+        'recovery_timeout',
+        'expected_exception',
+        'name',
+        'failure_count',
+        'last_failure_time',
+        'state',
+        '_last_failure_mono',
+        '_recovery_timeout_s',
+    )
+    
     def __init__(
         self,
         failure_threshold: int = 5,
@@ -50,40 +74,59 @@ class CircuitBreaker:
         """
         self.failure_threshold = failure_threshold
         self.recovery_timeout = recovery_timeout
-        self.expected_exception = expected_exception
+        self.expected_exception = _collapse_exceptions(expected_exception)
         self.name = name or "CircuitBreaker"
         
         self.failure_count = 0
+        # Wall-clock time is kept for error messages only; interval math uses the monotonic clock
         self.last_failure_time: Optional[datetime] = None
-        self.state = CircuitState.CLOSED
+        self._last_failure_mono = 0.0
+        self._recovery_timeout_s = float(recovery_timeout)
+        self.state = _CLOSED
         
     def _should_attempt_reset(self) -> bool:
         """Check if enough time has passed to attempt recovery."""
         return (
-            self.state == CircuitState.OPEN
-            and self.last_failure_time is not None
-            and datetime.now() >= self.last_failure_time + timedelta(seconds=self.recovery_timeout)
+            self.state is _OPEN
+            and (time.monotonic() - self._last_failure_mono) >= self._recovery_timeout_s
         )
     
     def _record_success(self):
         """Record successful call."""
         self.failure_count = 0
-        if self.state == CircuitState.HALF_OPEN:
+        if self.state is _HALF_OPEN:
             logger.info(f"{self.name}: Service recovered, closing circuit")
-        self.state = CircuitState.CLOSED
+        self.state = _CLOSED
         
     def _record_failure(self):
         """Record failed call."""
         self.failure_count += 1
+        self._last_failure_mono = time.monotonic()
         self.last_failure_time = datetime.now()
         
         if self.failure_count >= self.failure_threshold:
-            if self.state != CircuitState.OPEN:
+            if self.state is not _OPEN:
                 logger.error(
                     f"{self.name}: Failure threshold ({self.failure_threshold}) reached. "
                     f"Opening circuit for {self.recovery_timeout}s"
                 )
-            self.state = CircuitState.OPEN
+            self.state = _OPEN
+    
+    def _before_call(self):
+        """
+        Gate a call on the circuit state, moving to half-open once the recovery timeout has passed.
+        
+        Raises:
+            CircuitBreakerError: If circuit is open
+        """
+        if self.state is _OPEN:
+            if not self._should_attempt_reset():
+                raise CircuitBreakerError(
+                    f"{self.name}: Circuit breaker is OPEN. "
+                    f"Service unavailable until {self.last_failure_time + timedelta(seconds=self.recovery_timeout)}"
+                )
+            logger.info(f"{self.name}: Attempting recovery (half-open state)")
+            self.state = _HALF_OPEN
     
     async def call(self, func: Callable, *args, **kwargs) -> Any:
         """
@@ -100,21 +143,14 @@ class CircuitBreaker:
         Raises:
             CircuitBreakerError: If circuit is open
         """
-        if self._should_attempt_reset():
-            logger.info(f"{self.name}: Attempting recovery (half-open state)")
-            self.state = CircuitState.HALF_OPEN
-        
-        if self.state == CircuitState.OPEN:
-            raise CircuitBreakerError(
-                f"{self.name}: Circuit breaker is OPEN. "
-                f"Service unavailable until {self.last_failure_time + timedelta(seconds=self.recovery_timeout)}"
-            )
+        self._before_call()
         
         try:
             result = await func(*args, **kwargs)
             
             # Check for HTTP error status codes
-            if hasattr(result, 'status_code') and result.status_code >= 500:
+            status_code = getattr(result, 'status_code', None)
+            if status_code is not None and status_code >= 500:
                 self._record_failure()
             else:
                 self._record_success()
@@ -130,6 +166,46 @@ class CircuitBreaker:
             raise
 
 
+def get_circuit_breaker(name: str) -> Optional[CircuitBreaker]:
+    """
+    Return the shared circuit breaker registered under a name.
+    
+    Args:
+        name: Circuit breaker name (the decorator's name argument or the function's module-qualified name)
+        
+    Returns:
+        The registered CircuitBreaker, or None if no breaker uses that name
+    """
+    return _REGISTRY.get(name)
+
+
+def _get_or_create_circuit_breaker(name: str, **kwargs) -> CircuitBreaker:
+    """Return the breaker registered under name, creating it with kwargs on first use."""
+    with _REGISTRY_LOCK:
+        circuit_breaker = _REGISTRY.get(name)
+        if circuit_breaker is None:
+            circuit_breaker = CircuitBreaker(name=name, **kwargs)
+            _REGISTRY[name] = circuit_breaker
+        return circuit_breaker
+
+
+def get_breaker_for_host(host: str, **kwargs) -> CircuitBreaker:
+    """
+    Return the shared circuit breaker for a downstream host, creating it on first use.
+    
+    Every call path to the same host shares one breaker, so a failing host opens a
+    single circuit regardless of which endpoint tripped it.
+    
+    Args:
+        host: Host (and port) of the downstream service, e.g. "umr.internal:5138"
+        **kwargs: CircuitBreaker settings used when the breaker is first created
+        
+    Returns:
+        The CircuitBreaker registered for the host
+    """
+    return _get_or_create_circuit_breaker(f"host:{host}", **kwargs)
+
+
 def with_circuit_breaker(
     failure_threshold: int = 5,
     recovery_timeout: int = 60,
@@ -139,33 +215,54 @@ def with_circuit_breaker(
     """
     Decorator that applies circuit breaker pattern to async functions.
     
+    Decorations sharing the same name share one circuit breaker, so every call site
+    of a downstream dependency contributes to (and is protected by) a single state
+    machine. The first decoration for a name determines its settings.
+    
     Args:
         failure_threshold: Number of failures before opening circuit
         recovery_timeout: Seconds to wait before attempting recovery
         expected_exception: Exceptions that count as failures
-        name: Optional name for logging
+        name: Optional name for logging and sharing (defaults to the function's module and qualified name)
         
     Usage:
         @with_circuit_breaker(failure_threshold=5, recovery_timeout=60)
         async def my_http_call():
             ...
     """
-    # Create circuit breaker instance that persists across calls
-    circuit_breaker = CircuitBreaker(
-        failure_threshold=failure_threshold,
-        recovery_timeout=recovery_timeout,
-        expected_exception=expected_exception,
-        name=name
-    )
-    
     def decorator(func: Callable) -> Callable:
-        # Set name if not provided
-        if not name:
-            circuit_breaker.name = func.__name__
+        # Circuit breaker instance that persists across calls, shared by name
+        circuit_breaker = _get_or_create_circuit_breaker(
+            name or f"{func.__module__}.{func.__qualname__}",
+            failure_threshold=failure_threshold,
+            recovery_timeout=recovery_timeout,
+            expected_exception=expected_exception
+        )
             
-        @wraps(func)
+        expected_exceptions = circuit_breaker.expected_exception
+        
+        @wraps(func, assigned=_WRAPPER_ASSIGNMENTS, updated=())
         async def wrapper(*args, **kwargs) -> Any:
-            return await circuit_breaker.call(func, *args, **kwargs)
+            if circuit_breaker.state is not _CLOSED:
+                return await circuit_breaker.call(func, *args, **kwargs)
+            
+            # Closed circuit fast path: no gate check, and success only clears a non-zero count
+            try:
+                result = await func(*args, **kwargs)
+            except expected_exceptions:
+                circuit_breaker._record_failure()
+                raise
+            except Exception as e:
+                logger.warning(f"{circuit_breaker.name}: Unexpected exception (not counted): {type(e).__name__}: {str(e)}")
+                raise
+            
+            status_code = getattr(result, 'status_code', None)
+            if status_code is not None and status_code >= 500:
+                circuit_breaker._record_failure()
+            elif circuit_breaker.failure_count:
+                # Only consecutive failures may trip the breaker
+                circuit_breaker.failure_count = 0
+            return result
         
         # Expose circuit breaker for testing/monitoring
         wrapper.circuit_breaker = circuit_breaker
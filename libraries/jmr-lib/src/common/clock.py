@@ -0,0 +1,35 @@
+"""Fast UTC timestamp formatting for request hot paths."""
+import time
+
+# (epoch second, formatted "YYYY-MM-DDTHH:MM:SS" prefix) of the last call
+_iso_cache = (-1, "")
+
+
+def fast_utc_iso() -> str:
+    """
+    Return the current UTC time as an ISO 8601 string with microseconds.
+
+    The date/time prefix is only re-formatted when the wall-clock second changes,
+    avoiding a datetime allocation and isoformat() call per request. The output
+    matches datetime.now(timezone.utc).isoformat() byte for byte, so new values
+    compare and sort consistently with those already stored.
+
+    Returns:
+        Timestamp such as "2026-01-23T10:30:00.123456+00:00"
+    """
+    global _iso_cache
+    sec, frac = divmod(time.time_ns(), 1_000_000_000)
+    cached_sec, prefix = _iso_cache
+    if sec != cached_sec:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+        _iso_cache = (sec, prefix)
+    micros = frac // 1000
+    if not micros:
+        # isoformat() omits the fraction when microseconds are zero
+        return f"{prefix}+00:00"
+    return f"{prefix}.{micros:06d}+00:00"
+
+
+def fast_utc_date_iso() -> str:
+    """Return the current UTC date as an ISO 8601 string (e.g. "2026-01-23")."""
+    return fast_utc_iso()[:10]
@@ -0,0 +1,13 @@
+"""Correlation id generation for request tracing."""
+import os
+from contextvars import ContextVar
+from typing import Optional
+
+# Correlation id of the request being handled, set by the server's request middleware
+current_correlation_id: ContextVar[Optional[str]] = ContextVar("correlation_id", default=None)
+
+
+def new_correlation_id() -> str:
+    """Return a random 16 hex character correlation id for tracing a request."""
+    # os.urandom directly, skipping the secrets.token_hex wrapper; same 8 random bytes
+    return os.urandom(8).hex()
@@ -0,0 +1,131 @@
+"""Combined retry and circuit breaker decorator for resilient HTTP calls."""
+import asyncio
+import logging
+import time
+from functools import wraps
+from typing import Callable, Any, Dict, Optional
+from utility import logprovider
+from .circuit_breaker import _get_or_create_circuit_breaker
+from .retry import (
+    _WRAPPER_ASSIGNMENTS,
+    _RetryBudget,
+    _backoff_schedule,
+    _collapse_exceptions,
+    _is_retryable_exception,
+    _next_delay,
+)
+import httpx
+
+logger = logprovider.get_logger()
+
+_DEFAULT_EXCEPTIONS = (httpx.HTTPError, httpx.TimeoutException, httpx.ConnectError)
+
+
+def resilient(
+    *,
+    retry_cfg: Optional[Dict[str, Any]] = None,
+    cb_cfg: Optional[Dict[str, Any]] = None
+):
+    """
+    Decorator that fuses retry with backoff and circuit breaker protection in one wrapper.
+    
+    Equivalent to stacking @with_retry over @with_circuit_breaker, but each attempt
+    passes through a single coroutine frame and the response status is inspected once.
+    The circuit is checked before every attempt, so retries stop as soon as it opens.
+    
+    Args:
+        retry_cfg: with_retry options (max_retries, backoff_factor, status_forcelist,
+            exceptions, jitter, max_elapsed, max_delay, retry_budget)
+        cb_cfg: with_circuit_breaker options (failure_threshold, recovery_timeout, name)
+        
+    Raises:
+        CircuitBreakerError: If the circuit is open when an attempt is due
+        
+    Usage:
+        @resilient(retry_cfg={"max_retries": 3}, cb_cfg={"failure_threshold": 5})
+        async def my_http_call():
+            ...
+    """
+    retry_cfg = retry_cfg or {}
+    cb_cfg = cb_cfg or {}
+    
+    max_retries = retry_cfg.get("max_retries", 3)
+    backoff_factor = retry_cfg.get("backoff_factor", 0.5)
+    status_forcelist = retry_cfg.get("status_forcelist") or [500, 502, 503, 504]
+    exceptions = _collapse_exceptions(retry_cfg.get("exceptions", _DEFAULT_EXCEPTIONS))
+    jitter = retry_cfg.get("jitter", True)
+    max_elapsed = retry_cfg.get("max_elapsed")
+    retry_budget = retry_cfg.get("retry_budget")
+    
+    delays = _backoff_schedule(backoff_factor, max_retries, retry_cfg.get("max_delay"))
+    forcelist = frozenset(status_forcelist)
+    
+    def decorator(func: Callable) -> Callable:
+        # The same failure classification feeds both the breaker and the retry loop
+        circuit_breaker = _get_or_create_circuit_breaker(
+            cb_cfg.get("name") or f"{func.__module__}.{func.__qualname__}",
+            failure_threshold=cb_cfg.get("failure_threshold", 5),
+            recovery_timeout=cb_cfg.get("recovery_timeout", 60),
+            expected_exception=exceptions
+        )
+        budget = _RetryBudget(retry_budget) if retry_budget is not None else None
+        
+        @wraps(func, assigned=_WRAPPER_ASSIGNMENTS, updated=())
+        async def wrapper(*args, **kwargs) -> Any:
+            start = time.monotonic() if max_elapsed is not None else 0.0
+            
+            for attempt in range(max_retries + 1):
+                circuit_breaker._before_call()
+                
+                try:
+                    response = await func(*args, **kwargs)
+                except exceptions as e:
+                    circuit_breaker._record_failure()
+                    
+                    retryable = attempt < max_retries and _is_retryable_exception(e)
+                    delay = _next_delay(delays, attempt, jitter, start, max_elapsed, budget) if retryable else None
+                    if delay is None:
+                        logger.error(
+                            "Giving up on %s after %d attempt(s). Last exception: %s: %s",
+                            func.__name__, attempt + 1, type(e).__name__, e
+                        )
+                        raise
+                    if logger.isEnabledFor(logging.WARNING):
+                        logger.warning(
+                            "Attempt %d/%d failed with %s: %s. Retrying in %.3fs...",
+                            attempt + 1, max_retries + 1, type(e).__name__, e, delay
+                        )
+                    await asyncio.sleep(delay)
+                    continue
+                
+                status_code = getattr(response, 'status_code', None)
+                if status_code is not None and status_code >= 500:
+                    circuit_breaker._record_failure()
+                else:
+                    circuit_breaker._record_success()
+                
+                if status_code in forcelist:
+                    delay = _next_delay(delays, attempt, jitter, start, max_elapsed, budget) if attempt < max_retries else None
+                    if delay is None:
+                        logger.error(
+                            "Giving up on %s after %d attempt(s). Last status: %s",
+                            func.__name__, attempt + 1, status_code
+                        )
+                        return response
+                    if logger.isEnabledFor(logging.WARNING):
+                        logger.warning(
+                            "Attempt %d/%d failed with status %s. Retrying in %.3fs...",
+                            attempt + 1, max_retries + 1, status_code, delay
+                        )
+                    await asyncio.sleep(delay)
+                    continue
+                
+                if attempt > 0:
+                    logger.info("%s succeeded on attempt %d", func.__name__, attempt + 1)
+                return response
+        
+        # Expose circuit breaker for testing/monitoring
+        wrapper.circuit_breaker = circuit_breaker
+        return wrapper
+    
+    return decorator
@@ -1,18 +1,96 @@
 """Retry decorator with exponential backoff for resilient HTTP calls."""
 import asyncio
+import logging
+import random
+import time
 from functools import wraps
-from typing import Callable, Any, Optional, Sequence
+from typing import Callable, Any, Optional, Sequence, Tuple
 from utility import logprovider
 import httpx
 
 logger = logprovider.get_logger()
 
+# Copied onto wrappers instead of functools.WRAPPER_ASSIGNMENTS; __dict__ is not merged
+_WRAPPER_ASSIGNMENTS = ('__module__', '__name__', '__qualname__', '__doc__')
+
+
+def _collapse_exceptions(exceptions: Tuple[type, ...]) -> Tuple[type, ...]:
+    """Drop exception types already covered by a base class in the same tuple, keeping order."""
+    return tuple(dict.fromkeys(
+        exc for exc in exceptions
+        if not any(exc is not other and issubclass(exc, other) for other in exceptions)
+    ))
+
+
+# Client errors worth retrying when raised through raise_for_status()
+_RETRYABLE_CLIENT_STATUSES = frozenset({408, 429})
+
+
+class _RetryBudget:
+    """Caps the number of retries a decorated function may schedule per minute."""
+    
+    __slots__ = ('limit', '_window_start', '_used')
+    
+    def __init__(self, limit: int):
+        self.limit = limit
+        self._window_start = time.monotonic()
+        self._used = 0
+    
+    def try_acquire(self) -> bool:
+        """Consume one retry from the current one-minute window, if any are left."""
+        now = time.monotonic()
+        if now - self._window_start >= 60.0:
+            self._window_start = now
+            self._used = 0
+        if self._used >= self.limit:
+            return False
+        self._used += 1
+        return True
+
+
+def _backoff_schedule(backoff_factor: float, max_retries: int, max_delay: Optional[float] = None) -> Tuple[float, ...]:
+    """Return the exponential backoff delay for each retry attempt, capped at max_delay."""
+    delays = (backoff_factor * (1 << attempt) for attempt in range(max_retries))
+    if max_delay is not None:
+        return tuple(min(delay, max_delay) for delay in delays)
+    return tuple(delays)
+
+
+def _next_delay(
+    delays: Tuple[float, ...],
+    attempt: int,
+    jitter: bool,
+    start: float,
+    max_elapsed: Optional[float],
+    budget: Optional[_RetryBudget] = None
+) -> Optional[float]:
+    """Return the sleep before the next attempt, or None if the deadline or retry budget is exhausted."""
+    delay = random.uniform(0, delays[attempt]) if jitter else delays[attempt]
+    if max_elapsed is not None and time.monotonic() - start + delay > max_elapsed:
+        return None
+    if budget is not None and not budget.try_acquire():
+        logger.warning("Retry budget of %d per minute exhausted", budget.limit)
+        return None
+    return delay
+
+
+def _is_retryable_exception(exc: BaseException) -> bool:
+    """Return False for HTTP client errors (4xx other than 408/429), which a retry cannot fix."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        status_code = exc.response.status_code
+        return not (400 <= status_code < 500) or status_code in _RETRYABLE_CLIENT_STATUSES
+    return True
+
 
 def with_retry(
     max_retries: int = 3,
     backoff_factor: float = 0.5,
     status_forcelist: Optional[Sequence[int]] = None,
-    exceptions: tuple = (httpx.HTTPError, httpx.TimeoutException, httpx.ConnectError)
+    exceptions: tuple = (httpx.HTTPError, httpx.TimeoutException, httpx.ConnectError),
+    jitter: bool = True,
+    max_elapsed: Optional[float] = None,
+    max_delay: Optional[float] = None,
+    retry_budget: Optional[int] = None
 ):
     """
     Decorator that implements retry logic with exponential backoff.
@@ -22,6 +100,12 @@ def with_retry(
         backoff_factor: Multiplier for exponential backoff (delay = backoff_factor * (2 ** attempt))
         status_forcelist: HTTP status codes that should trigger a retry
         exceptions: Tuple of exceptions that should trigger a retry
+        jitter: Apply full jitter (sleep a random time in [0, delay]) to avoid synchronized retries
+        max_elapsed: Optional overall deadline in seconds; no retry is scheduled that would exceed it
+        max_delay: Optional cap in seconds on any single backoff delay
+        retry_budget: Optional maximum number of retries per minute across all calls
+        
+    HTTPStatusError for client errors (4xx other than 408 and 429) is never retried.
         
     Usage:
         @with_retry(max_retries=3, backoff_factor=0.5, status_forcelist=[500, 502, 503, 504])
@@ -31,51 +115,67 @@ def with_retry(
     if status_forcelist is None:
         status_forcelist = [500, 502, 503, 504]
     
+    # Fixed per decoration: precompute the backoff schedule and an O(1) status lookup
+    exceptions = _collapse_exceptions(exceptions)
+    delays = _backoff_schedule(backoff_factor, max_retries, max_delay)
+    forcelist = frozenset(status_forcelist)
+    
     def decorator(func: Callable) -> Callable:
-        @wraps(func)
+        # Nothing to retry: call the function directly without a wrapper frame
+        if max_retries == 0:
+            return func
+        
+        budget = _RetryBudget(retry_budget) if retry_budget is not None else None
+        
+        @wraps(func, assigned=_WRAPPER_ASSIGNMENTS, updated=())
         async def wrapper(*args, **kwargs) -> Any:
             last_exception = None
+            start = time.monotonic() if max_elapsed is not None else 0.0
             
             for attempt in range(max_retries + 1):
                 try:
                     response = await func(*args, **kwargs)
                     
-                    # Check if response has status_code attribute (httpx.Response)
-                    if hasattr(response, 'status_code') and response.status_code in status_forcelist:
-                        if attempt < max_retries:
-                            delay = backoff_factor * (2 ** attempt)
-                            logger.warning(
-                                f"Attempt {attempt + 1}/{max_retries + 1} failed with status {response.status_code}. "
-                                f"Retrying in {delay}s..."
-                            )
+                    # Responses without a status_code (non-httpx returns) are never retried
+                    status_code = getattr(response, 'status_code', None)
+                    if status_code is not None and status_code in forcelist:
+                        delay = _next_delay(delays, attempt, jitter, start, max_elapsed, budget) if attempt < max_retries else None
+                        if delay is not None:
+                            if logger.isEnabledFor(logging.WARNING):
+                                logger.warning(
+                                    "Attempt %d/%d failed with status %s. Retrying in %.3fs...",
+                                    attempt + 1, max_retries + 1, status_code, delay
+                                )
                             await asyncio.sleep(delay)
                             continue
                         else:
                             logger.error(
-                                f"Max retries ({max_retries}) reached for {func.__name__}. "
-                                f"Last status: {response.status_code}"
+                                "Giving up on %s after %d attempt(s). Last status: %s",
+                                func.__name__, attempt + 1, status_code
                             )
                             return response
                     
                     # Success
                     if attempt > 0:
-                        logger.info(f"{func.__name__} succeeded on attempt {attempt + 1}")
+                        logger.info("%s succeeded on attempt %d", func.__name__, attempt + 1)
                     return response
                     
                 except exceptions as e:
                     last_exception = e
                     
-                    if attempt < max_retries:
-                        delay = backoff_factor * (2 ** attempt)
-                        logger.warning(
-                            f"Attempt {attempt + 1}/{max_retries + 1} failed with {type(e).__name__}: {str(e)}. "
-                            f"Retrying in {delay}s..."
-                        )
+                    retryable = attempt < max_retries and _is_retryable_exception(e)
+                    delay = _next_delay(delays, attempt, jitter, start, max_elapsed, budget) if retryable else None
+                    if delay is not None:
+                        if logger.isEnabledFor(logging.WARNING):
+                            logger.warning(
+                                "Attempt %d/%d failed with %s: %s. Retrying in %.3fs...",
+                                attempt + 1, max_retries + 1, type(e).__name__, e, delay
+                            )
                         await asyncio.sleep(delay)
                     else:
                         logger.error(
-                            f"Max retries ({max_retries}) reached for {func.__name__}. "
-                            f"Last exception: {type(e).__name__}: {str(e)}"
+                            "Giving up on %s after %d attempt(s). Last exception: %s: %s",
+                            func.__name__, attempt + 1, type(e).__name__, e
                         )
                         raise
             
@@ -0,0 +1,19 @@
+"""Fast JSON serialization of tool results."""
+from typing import Any
+import orjson
+
+
+def dumps_json(data: Any) -> str:
+    """
+    Serialize a tool result to a JSON string with orjson.
+
+    Values orjson cannot encode natively fall back to str(), and non-string
+    dictionary keys are allowed.
+
+    Args:
+        data: Result to serialize
+
+    Returns:
+        JSON text of the result
+    """
+    return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
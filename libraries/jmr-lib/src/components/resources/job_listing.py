@@ -1,152 +1,171 @@
 # from ast import And
-from utility import logprovider
+from utility import logprovider, log_span
 from mcp.types import Resource, ResourceTemplate, TextContent
 from models.handler.base_resource_handler import BaseResourceHandler
-from typing import List, Any, Dict, Optional, Union
-import uuid
+from typing import List, Any, Dict, Optional, Tuple, Union
+import asyncio
 import json
+import re
+import weakref
 from mcp.server.fastmcp import Context
 from mcp.server.session import ServerSession
 from models.context.dbcontext import DbContext
-from models.domain.jobs.job import Job
-from datetime import datetime, timezone
-from beanie.operators import GTE, And
+from models.domain.jobs.job import Job, JobPublic
+from components.tools.job_listing import _JOBS_ADAPTER
+from common import fast_utc_date_iso, new_correlation_id, current_correlation_id, BatchLoader
+from beanie.operators import GTE, In
 from urllib.parse import unquote
 
 logger = logprovider.get_logger()
 
+# Matches every URI served by this handler in a single pass
+_URI_RE = re.compile(r"^jobs://(?:(today)|details/([^/]+)|views/([^/]+))$")
+
+# Static resource metadata, built once and shared by every handler instance
+_DIRECT_RESOURCES: Tuple[Resource, ...] = (
+    Resource(
+        uri="jobs://today",
+        name="Active Job Listings",
+        description="Access only active job listings (non-closed positions).",
+        mimeType="application/json"
+    ),
+)
+_RESOURCE_TEMPLATES: Tuple[ResourceTemplate, ...] = (
+    ResourceTemplate(
+        uriTemplate="jobs://details/{job_id}",
+        name="Job Listing Details",
+        description="Access detailed information for a specific job listing by ID.",
+        mimeType="application/json"
+    ),
+    ResourceTemplate(
+        uriTemplate="jobs://views/{job_id}",
+        name="Listed Job view count",
+        description="get view count for a specific job listing by ID.",
+        mimeType="application/json"
+    ),
+)
+_RESOURCES: Tuple[Union[Resource, ResourceTemplate], ...] = _DIRECT_RESOURCES + _RESOURCE_TEMPLATES
+
+
+async def _load_jobs(job_ids: List[str]) -> Dict[str, JobPublic]:
+    """Fetch the projected jobs for a batch of job ids in one query."""
+    jobs = await Job.find(In(Job.job_id, job_ids), projection_model=JobPublic).to_list()
+    return {job.job_id: job for job in jobs}
+
+# Concurrent detail and view-count reads for the same jobs share one round-trip. A loader's
+# futures belong to one event loop, so each running loop gets its own, dropped with the loop
+_JOB_LOADERS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, BatchLoader[str, JobPublic]]" = weakref.WeakKeyDictionary()
+
+
+def _job_loader() -> BatchLoader[str, JobPublic]:
+    """Return the job loader for the running event loop, created on first use."""
+    loop = asyncio.get_running_loop()
+    loader = _JOB_LOADERS.get(loop)
+    if loader is None:
+        loader = _JOB_LOADERS[loop] = BatchLoader(_load_jobs)
+    return loader
+
 
 class JobListingResource(BaseResourceHandler):
     """A resource handler for exposing job listings."""
 
+    __slots__ = ('_corr',)
+
     def __init__(self, correlation_id: Optional[str] = None):
-        self.correlation_id = correlation_id or str(uuid.uuid4())
+        self._corr = correlation_id or None
+
+    @property
+    def correlation_id(self) -> str:
+        """Correlation id of the current request, else this instance's id (generated on first use)."""
+        corr = current_correlation_id.get()
+        if corr is not None:
+            return corr
+        corr = self._corr
+        if corr is None:
+            corr = self._corr = new_correlation_id()
+        return corr
 
     @property
-    def direct_resources(self) -> List[Resource]:
+    def direct_resources(self) -> Tuple[Resource, ...]:
         """Direct resources with static URIs."""
-        return [
-            Resource(
-                uri="jobs://today",
-                name="Active Job Listings",
-                description="Access only active job listings (non-closed positions).",
-                mimeType="application/json"
-            )
-        ]
+        return _DIRECT_RESOURCES
     
     @property
-    def resource_templates(self) -> List[ResourceTemplate]:
+    def resource_templates(self) -> Tuple[ResourceTemplate, ...]:
         """Resource templates with dynamic URI parameters."""
-        return [
-            ResourceTemplate(
-                uriTemplate="jobs://details/{job_id}",
-                name="Job Listing Details",
-                description="Access detailed information for a specific job listing by ID.",
-                mimeType="application/json"
-            ),
-            ResourceTemplate(
-                uriTemplate="jobs://views/{job_id}",
-                name="Listed Job view count",
-                description="get view count for a specific job listing by ID.",
-                mimeType="application/json"
-            )
-        ]
+        return _RESOURCE_TEMPLATES
     
     @property
-    def resources(self) -> List[Union[Resource, ResourceTemplate]]:
+    def resources(self) -> Tuple[Union[Resource, ResourceTemplate], ...]:
         """Combined list of all resources (direct and templates)."""
-        combined = self.direct_resources + self.resource_templates
-        return combined
+        return _RESOURCES
 
     async def read_resource(self, uri: str) -> str:
         """Read resource content by URI."""
                
         # Decode the URI to handle any URL-encoded characters
-        decoded_uri = unquote(uri)
+        decoded_uri = unquote(uri) if '%' in uri else uri
+        
+        match = _URI_RE.match(decoded_uri)
+        if match is None:
+            raise ValueError(f"Unknown resource URI: {uri}")
         
-        if decoded_uri == "jobs://today":
+        today, details_id, views_id = match.groups()
+        if today:
             return await self._fetch_active_jobs()
-        elif decoded_uri.startswith("jobs://views/"):
-            job_id = decoded_uri.replace("jobs://views/", "")
-            return await self._fetch_job_views(job_id)
-        elif decoded_uri.startswith("jobs://details/"):
-            job_id = decoded_uri.replace("jobs://details/", "")
-            return await self._fetch_job_by_id(job_id)
+        elif views_id is not None:
+            return await self._fetch_job_views(views_id)
         else:
-            raise ValueError(f"Unknown resource URI: {uri}")
+            return await self._fetch_job_by_id(details_id)
 
     async def _fetch_active_jobs(self) -> str:
         """Fetch only todays active job listings."""
-        try:
-            logger.info(f"Fetching active job listings - correlation_id: {self.correlation_id}")
-            
+        log_extra = {"correlation_id": self.correlation_id}
+        with log_span("_fetch_active_jobs", logger, **log_extra):
             # Get active jobs posted today (compare date only, not time)
             # Since posted_date is a string, we compare with date string format
-            today_date_str = datetime.now(timezone.utc).date().isoformat()
-            jobs = await Job.find(GTE(Job.posted_date, today_date_str)).to_list()
-            
-            # Convert to dictionaries, exclude views for privacy
-            jobs_data = [job.model_dump(exclude={'views'}) for job in jobs]
+            today_date_str = fast_utc_date_iso()
+            # Project server-side so the views array is never transferred
+            jobs = await Job.find(GTE(Job.posted_date, today_date_str), projection_model=JobPublic).to_list()
         
-            logger.info(f"Retrieved {len(jobs_data)} active job listings - correlation_id: {self.correlation_id}")
-            return json.dumps(jobs_data, default=str)
-        except Exception as e:
-            logger.error(f"Error fetching active jobs: {str(e)} - correlation_id: {self.correlation_id}")
-            raise
-        finally:
-            logger.info(f"Completed _fetch_active_jobs operation - correlation_id: {self.correlation_id}")
+            logger.info("Retrieved %d active job listings", len(jobs), extra=log_extra)
+            return _JOBS_ADAPTER.dump_json(jobs).decode()
 
     async def _fetch_job_by_id(self, job_id: str) -> str:
         """Fetch a specific job listing by ID."""
-        try:
+        log_extra = {"correlation_id": self.correlation_id, "job_id": job_id}
+        with log_span("_fetch_job_by_id", logger, **log_extra):
             if not job_id:
                 raise ValueError("job_id is required")
             
-            logger.info(f"Fetching job listing by ID: {job_id} - correlation_id: {self.correlation_id}")
-            
-            job = await Job.find_one(Job.job_id == job_id)
+            # Projected server-side so the views array is never transferred
+            job = await _job_loader().load(job_id)
             
             if not job:
-                logger.warning(f"Job not found with ID: {job_id} - correlation_id: {self.correlation_id}")
+                logger.warning("Job not found with ID: %s", job_id, extra=log_extra)
                 return json.dumps({"error": f"Job not found with ID: {job_id}"})
             
-            # Convert to dictionary, exclude views for privacy
-            job_data = job.model_dump(exclude={'views'})
-            job_data['view_count'] = len(job.views) if job.views else 0
-            
-            logger.info(f"Retrieved job listing with ID: {job_id} - correlation_id: {self.correlation_id}")
-            return json.dumps(job_data, default=str)
-        except Exception as e:
-            logger.error(f"Error fetching job by ID: {str(e)} - correlation_id: {self.correlation_id}")
-            raise
-        finally:
-            logger.info(f"Completed _fetch_job_by_id operation - correlation_id: {self.correlation_id}")
+            return job.model_dump_json()
 
     async def _fetch_job_views(self, job_id: str) -> str:
         """Fetch view count for a specific job listing by ID."""
-        try:
+        log_extra = {"correlation_id": self.correlation_id, "job_id": job_id}
+        with log_span("_fetch_job_views", logger, **log_extra):
             if not job_id:
                 raise ValueError("job_id is required")
             
-            logger.info(f"Fetching view count for job ID: {job_id} - correlation_id: {self.correlation_id}")
-            
-            job = await Job.find_one(Job.job_id == job_id)
+            job = await _job_loader().load(job_id)
             
             if not job:
-                logger.warning(f"Job not found with ID: {job_id} - correlation_id: {self.correlation_id}")
+                logger.warning("Job not found with ID: %s", job_id, extra=log_extra)
                 return json.dumps({"error": f"Job not found with ID: {job_id}", "job_id": job_id, "view_count": 0})
             
-            view_count = len(job.views) if job.views else 0
+            view_count = job.view_count
             
             result = {
                 "job_id": job_id,
                 "view_count": view_count
             }
             
-            logger.info(f"Retrieved {view_count} views for job ID: {job_id} - correlation_id: {self.correlation_id}")
+            logger.info("Retrieved %d views for job ID: %s", view_count, job_id, extra=log_extra)
             return json.dumps(result, default=str)
-        except Exception as e:
-            logger.error(f"Error fetching job views: {str(e)} - correlation_id: {self.correlation_id}")
-            raise
-        finally:
-            logger.info(f"Completed _fetch_job_views operation - correlation_id: {self.correlation_id}")
@@ -1,72 +1,100 @@
-from pymongo import AsyncMongoClient
-from utility import logprovider
+from pymongo import AsyncMongoClient, ReturnDocument
+from utility import logprovider, log_span
 from mcp.types import Tool, TextContent
 from models.handler.base_tool_handler import BaseToolHandler
-from typing import List, Any, Dict, Optional
-import uuid
-from datetime import datetime, timezone
+from typing import List, Any, Dict, Optional, Tuple
 from mcp.server.fastmcp import Context
 from mcp.server.session import ServerSession
 from models.context.dbcontext import DbContext
-from models.domain.jobs.job import Job, JobFilter , JobFilterHelpers, View
+from models.domain.jobs.job import Job, JobPublic, JobFilter , JobFilterHelpers, View
 from components.tools.schemas import JOB_FILTER_SCHEMA, JOB_SCHEMA, JOB_VIEW_SCHEMA
-import json
+from common import fast_utc_iso, new_correlation_id, current_correlation_id, dumps_json
+from pydantic import TypeAdapter
 
 logger = logprovider.get_logger()
 
+# Projection returning only the number of views on the updated job
+_VIEW_COUNT_PROJECTION = {"_id": 0, "total_job_views": {"$size": {"$ifNull": ["$views", []]}}}
+
+# Serializers for list results, dumped to JSON bytes by pydantic-core without building dicts
+_JOBS_ADAPTER = TypeAdapter(List[JobPublic])
+_VIEWS_ADAPTER = TypeAdapter(List[View])
+
+# Static tool metadata, built once and shared by every handler instance
+_TOOLS: Tuple[Tool, ...] = (
+    Tool(
+        name="fetch_job_listings",
+        description="Fetch job listings from the database based on criteria.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "filter": JOB_FILTER_SCHEMA
+            },
+            "required": []
+        },
+        tags=["carevo", "jobs", "filter", "nosql", "internal"]
+    ),
+    Tool(
+        name="create_job_listing",
+        description="Create a new job listing in the database.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "job": JOB_SCHEMA
+            },
+            "required": ["job"]
+        },
+        tags=["carevo", "job", "user", "nosql", "internal"]
+    ),
+    Tool(
+        name="get_job_views",
+        description="Get views for a specific job listing.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "jobid": {"type": "string", "description": "Data for the new job listing"}
+            },
+            "required": ["jobid"]
+        },
+        tags=["carevo", "jobviews", "jobid", "nosql", "internal"]
+    ),
+    Tool(
+        name="create_job_view",
+        description="Create or update a view for a job listing. Updates view_date if user has already viewed the job.",
+        inputSchema=JOB_VIEW_SCHEMA,
+        tags=["carevo", "job", "view", "nosql", "internal"]
+    ),
+)
+
 
 class JobListingTool(BaseToolHandler):
     """A tool for managing job listings."""
 
+    __slots__ = ('_corr', '_dispatch')
+
     def __init__(self, correlation_id: Optional[str] = None):
-        self.correlation_id = correlation_id or str(uuid.uuid4())
+        self._corr = correlation_id or None
+        self._dispatch = {
+            "fetch_job_listings": self._handle_fetch_job_listings,
+            "create_job_listing": self._handle_create_job_listing,
+            "get_job_views": self._handle_get_job_views,
+            "create_job_view": self._handle_create_job_view,
+        }
+
+    @property
+    def correlation_id(self) -> str:
+        """Correlation id of the current request, else this instance's id (generated on first use)."""
+        corr = current_correlation_id.get()
+        if corr is not None:
+            return corr
+        corr = self._corr
+        if corr is None:
+            corr = self._corr = new_correlation_id()
+        return corr
 
     @property
-    def tools(self) -> List[Tool]:
-        return [
-            Tool(
-                name="fetch_job_listings",
-                description="Fetch job listings from the database based on criteria.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "filter": JOB_FILTER_SCHEMA
-                    },
-                    "required": []
-                },
-                tags=["carevo", "jobs", "filter", "nosql", "internal"]
-            ),
-            Tool(
-                name="create_job_listing",
-                description="Create a new job listing in the database.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "job": JOB_SCHEMA
-                    },
-                    "required": ["job"]
-                },
-                tags=["carevo", "job", "user", "nosql", "internal"]
-            ),
-            Tool(
-                name="get_job_views",
-                description="Get views for a specific job listing.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "jobid": {"type": "string", "description": "Data for the new job listing"}
-                    },
-                    "required": ["jobid"]
-                },
-                tags=["carevo", "jobviews", "jobid", "nosql", "internal"]
-            ),
-            Tool(
-                name="create_job_view",
-                description="Create or update a view for a job listing. Updates view_date if user has already viewed the job.",
-                inputSchema=JOB_VIEW_SCHEMA,
-                tags=["carevo", "job", "view", "nosql", "internal"]
-            )
-        ]
+    def tools(self) -> Tuple[Tool, ...]:
+        return _TOOLS
     
 
     async def execute(self, arguments: Dict[str, Any]) -> List[TextContent]:
@@ -77,147 +105,146 @@ class JobListingTool(BaseToolHandler):
         if not ctx:
             raise ValueError("Context is required for tool execution")
         
-        if tool_name == "fetch_job_listings":
-            filter_data = input_data.get("filter")
-            filter_obj = JobFilter(**filter_data) if filter_data else JobFilter()
-            result = await self.fetch_job_listings(filter_obj, ctx)
-            # Convert Job objects to dictionaries, exclude views for privacy (only expose view_count)
-            jobs_data = [job.model_dump(exclude={'views'}) for job in result]
-            return [TextContent(type="text", text=json.dumps(jobs_data, default=str))]
-        
-        elif tool_name == "create_job_listing":
-            job_data = input_data.get("job")
-            job_obj = Job(**job_data) if job_data else None
-            result = await self.create_job_listing(job_obj, ctx)
-            # Exclude views for privacy (only expose view_count)
-            return [TextContent(type="text", text=json.dumps(result.model_dump(exclude={'views'}), default=str))]
-        
-        elif tool_name == "get_job_views":
-            job_id = input_data.get("jobid")
-            result = await self.get_job_views(job_id, ctx)
-            # Convert View objects to dictionaries
-            views_data = [view.model_dump() for view in result]
-            return [TextContent(type="text", text=json.dumps(views_data, default=str))]
-        
-        elif tool_name == "create_job_view":
-            job_id = input_data.get("job_id")
-            user_id = input_data.get("user_id")
-            result = await self.create_job_view(job_id, user_id, ctx)
-            # Result is already a dictionary
-            return [TextContent(type="text", text=json.dumps(result, default=str))]
-        
-        else:
+        handler = self._dispatch.get(tool_name)
+        if handler is None:
             raise ValueError(f"Unknown tool: {tool_name}")
+        
+        payload = await handler(input_data, ctx)
+        return [TextContent(type="text", text=payload)]
+    
+    async def _handle_fetch_job_listings(self, input_data: Dict[str, Any], ctx: Context[ServerSession, DbContext]) -> str:
+        filter_data = input_data.get("filter")
+        filter_obj = JobFilter(**filter_data) if filter_data else JobFilter()
+        result = await self.fetch_job_listings(filter_obj, ctx)
+        # Serialize straight to JSON; the projection already omits views for privacy
+        return _JOBS_ADAPTER.dump_json(result).decode()
     
-    async def fetch_job_listings(self, filter: JobFilter, ctx: Context[ServerSession, DbContext]) -> List[Job]:
+    async def _handle_create_job_listing(self, input_data: Dict[str, Any], ctx: Context[ServerSession, DbContext]) -> str:
+        job_data = input_data.get("job")
+        job_obj = Job(**job_data) if job_data else None
+        result = await self.create_job_listing(job_obj, ctx)
+        # Exclude views for privacy (only expose view_count)
+        return result.model_dump_json(exclude={'views'})
+    
+    async def _handle_get_job_views(self, input_data: Dict[str, Any], ctx: Context[ServerSession, DbContext]) -> str:
+        job_id = input_data.get("jobid")
+        result = await self.get_job_views(job_id, ctx)
+        return _VIEWS_ADAPTER.dump_json(result).decode()
+    
+    async def _handle_create_job_view(self, input_data: Dict[str, Any], ctx: Context[ServerSession, DbContext]) -> str:
+        job_id = input_data.get("job_id")
+        user_id = input_data.get("user_id")
+        result = await self.create_job_view(job_id, user_id, ctx)
+        # Result is already a dictionary
+        return dumps_json(result)
+    
+    async def fetch_job_listings(self, filter: JobFilter, ctx: Context[ServerSession, DbContext]) -> List[JobPublic]:
         """Fetch school details by name."""
-        try:
+        log_extra = {"correlation_id": self.correlation_id}
+        with log_span("fetch_job_listings", logger, **log_extra):
              # Access the async driver from the lifespan context
             # client: AsyncMongoClient = ctx.request_context.lifespan_context.client 
 
             query = JobFilterHelpers().build_filter_query(filter)
-            logger.info(f"Fetching job listings with filter: {filter} - correlation_id: {self.correlation_id}")
             
-            jobs = await Job.find(query).to_list()
-            logger.info(f"Fetched {len(jobs)} job listings with filter: {filter} - correlation_id: {self.correlation_id}")
+            # Project server-side so the views array is never transferred
+            jobs = await Job.find(query, projection_model=JobPublic).to_list()
+            logger.info("Fetched %d job listings with filter: %s", len(jobs), filter, extra=log_extra)
             return jobs
-        except Exception as e:
-            logger.error(f"Error fetching job listings: {str(e)} - correlation_id: {self.correlation_id}")
-            raise
-        finally:
-            logger.info(f"Completed fetch_job_listings operation - correlation_id: {self.correlation_id}")
 
     async def create_job_listing(self, job: Job, ctx: Context[ServerSession, DbContext]) -> Job:
         """Create a new job listing in the database."""
-        try:
+        log_extra = {"correlation_id": self.correlation_id}
+        with log_span("create_job_listing", logger, **log_extra):
             # Access the async driver from the lifespan context
             # client: AsyncMongoClient = ctx.request_context.lifespan_context.client
             
             if not job:
                 raise ValueError("Job data is required to create a job listing")
             
-            logger.info(f"Creating job listing: {job.title} at {job.company} - correlation_id: {self.correlation_id}")
+            # Keep the stored count in step with any views supplied at creation
+            job.view_count = len(job.views)
             
             # Insert the job document using Beanie
             await job.insert()
             
-            logger.info(f"Successfully created job listing with ID: {job.id} - correlation_id: {self.correlation_id}")
+            logger.info("Created job listing %s at %s with ID: %s", job.title, job.company, job.id, extra=log_extra)
             return job
-        except Exception as e:
-            logger.error(f"Error creating job listing: {str(e)} - correlation_id: {self.correlation_id}")
-            raise
-        finally:
-            logger.info(f"Completed create_job_listing operation - correlation_id: {self.correlation_id}")
 
     async def get_job_views(self, job_id: str, ctx: Context[ServerSession, DbContext]) -> List[View]:
         """Dedicated method to fetch views for a specific job."""
-        try:
+        log_extra = {"correlation_id": self.correlation_id, "job_id": job_id}
+        with log_span("get_job_views", logger, **log_extra):
             # client: AsyncMongoClient = ctx.request_context.lifespan_context.client
             
-            logger.info(f"Fetching views for job ID: {job_id} - correlation_id: {self.correlation_id}")
-            
             job = await Job.find_one(Job.job_id == job_id)
             if not job:
-                logger.warning(f"Job not found with ID: {job_id} - correlation_id: {self.correlation_id}")
+                logger.warning("Job not found with ID: %s", job_id, extra=log_extra)
                 return []
             
-            logger.info(f"Retrieved {len(job.views)} views for job ID: {job_id} - correlation_id: {self.correlation_id}")
+            logger.info("Retrieved %d views for job ID: %s", len(job.views), job_id, extra=log_extra)
             return job.views if job else []
-        except Exception as e:
-            logger.error(f"Error fetching job views: {str(e)} - correlation_id: {self.correlation_id}")
-            raise
-        finally:
-            logger.info(f"Completed get_job_views operation - correlation_id: {self.correlation_id}")
 
     async def create_job_view(self, job_id: str, user_id: str, ctx: Context[ServerSession, DbContext]) -> Dict[str, Any]:
         """Create or update a view for a job listing."""
-        try:
+        log_extra = {"correlation_id": self.correlation_id, "job_id": job_id}
+        with log_span("create_job_view", logger, **log_extra):
             # client: AsyncMongoClient = ctx.request_context.lifespan_context.client
             
             if not job_id or not user_id:
                 raise ValueError("job_id and user_id are required")
             
-            logger.info(f"Creating/updating view for job ID: {job_id}, user ID: {user_id} - correlation_id: {self.correlation_id}")
+            # Get current UTC timestamp
+            current_utc = fast_utc_iso()
+            collection = Job.get_pymongo_collection()
             
-            # Find the job
-            job = await Job.find_one(Job.job_id == job_id)
-            if not job:
-                raise ValueError(f"Job not found with ID: {job_id}")
+            # Refresh the user's existing view in place; returns only the view count
+            updated = await self._refresh_view(collection, job_id, user_id, current_utc)
             
-            # Get current UTC datetime
-            current_utc = datetime.now(timezone.utc).isoformat()
-            
-            # Check if user has already viewed this job
-            existing_view = next((view for view in job.views if view.user_id == user_id), None)
-            
-            if existing_view is not None:
-                # Update existing view
-                existing_view.view_date = current_utc
+            if updated is not None:
                 action = "updated"
-                logger.info(f"Updated existing view for user {user_id} on job {job_id} - correlation_id: {self.correlation_id}")
             else:
-                # Create new view
-                new_view = View(user_id=user_id, view_date=current_utc)
-                job.views.append(new_view)
-                logger.info(f"Created new view for user {user_id} on job {job_id} - correlation_id: {self.correlation_id}")
-                action = "created"
-            
-            # Save the updated job
-            await job.save()
+                # No view for this user yet - append one unless a concurrent call already did
+                # Pipeline update so view_count is recomputed from the stored views in the same
+                # write, which also corrects documents written before view_count existed
+                view = View(user_id=user_id, view_date=current_utc).model_dump()
+                updated = await collection.find_one_and_update(
+                    {"job_id": job_id, "views.user_id": {"$ne": user_id}},
+                    [{
+                        "$set": {
+                            "views": {"$concatArrays": [{"$ifNull": ["$views", []]}, [{"$literal": view}]]},
+                            "view_count": {"$add": [{"$size": {"$ifNull": ["$views", []]}}, 1]}
+                        }
+                    }],
+                    projection=_VIEW_COUNT_PROJECTION,
+                    return_document=ReturnDocument.AFTER
+                )
+                if updated is not None:
+                    action = "created"
+                else:
+                    # A concurrent call may have pushed this user's view first; refresh that one
+                    updated = await self._refresh_view(collection, job_id, user_id, current_utc)
+                    if updated is None:
+                        raise ValueError(f"Job not found with ID: {job_id}")
+                    action = "updated"
             
             result = {
                 "job_id": job_id,
                 "user_id": user_id,
                 "view_date": current_utc,
                 "action": action,
-                "total_job_views": len(job.views)
+                "total_job_views": updated["total_job_views"]
             }
             
-            logger.info(f"Successfully {action} view for job {job_id} - correlation_id: {self.correlation_id}")
+            logger.info("Successfully %s view for user %s on job %s", action, user_id, job_id, extra=log_extra)
             return result
-            
-        except Exception as e:
-            logger.error(f"Error creating job view: {str(e)} - correlation_id: {self.correlation_id}")
-            raise
-        finally:
-            logger.info(f"Completed create_job_view operation - correlation_id: {self.correlation_id}")
+
+    @staticmethod
+    async def _refresh_view(collection: Any, job_id: str, user_id: str, view_date: str) -> Optional[Dict[str, Any]]:
+        """Set the view date of the user's existing view, returning the view count or None if there is none."""
+        return await collection.find_one_and_update(
+            {"job_id": job_id, "views.user_id": user_id},
+            {"$set": {"views.$.view_date": view_date}},
+            projection=_VIEW_COUNT_PROJECTION,
+            return_document=ReturnDocument.AFTER
+        )
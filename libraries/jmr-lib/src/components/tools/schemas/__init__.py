@@ -1,26 +1,49 @@
 """Schema definitions for MCP tools."""
-import json
+import copy
+import orjson
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any
 
+_SCHEMA_DIR = Path(__file__).parent
+
+# Module attributes resolved lazily through __getattr__ (PEP 562)
+_EXPORTS = {
+    "JOB_FILTER_SCHEMA": "job_filter_schema",
+    "JOB_SCHEMA": "job_schema",
+    "JOB_VIEW_SCHEMA": "job_view_schema",
+    "APPLICATION_CREATE_SCHEMA": "application_create_schema",
+    "APPLICATION_UPDATE_SCHEMA": "application_update_schema",
+}
+
+__all__ = ["load_schema", *_EXPORTS]
+
+
+@lru_cache(maxsize=None)
+def _parse_schema(schema_name: str) -> Dict[str, Any]:
+    """Parse a schema file once; the result is shared and must not be handed out directly."""
+    schema_path = _SCHEMA_DIR / f"{schema_name}.json"
+    return orjson.loads(schema_path.read_bytes())
+
 
 def load_schema(schema_name: str) -> Dict[str, Any]:
     """Load a JSON schema from the schemas directory.
-    
+
     Args:
         schema_name: Name of the schema file (without .json extension)
-        
+
     Returns:
-        Dict containing the schema definition
+        Dict containing the schema definition; a fresh copy the caller may modify
     """
-    schema_path = Path(__file__).parent / f"{schema_name}.json"
-    with open(schema_path, 'r') as f:
-        return json.load(f)
+    return copy.deepcopy(_parse_schema(schema_name))
+
 
+def __getattr__(name: str) -> Dict[str, Any]:
+    """Lazily resolve the commonly used schema constants on first access."""
+    schema_name = _EXPORTS.get(name)
+    if schema_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# Pre-load commonly used schemas
-JOB_FILTER_SCHEMA = load_schema("job_filter_schema")
-JOB_SCHEMA = load_schema("job_schema")
-JOB_VIEW_SCHEMA = load_schema("job_view_schema")
-APPLICATION_CREATE_SCHEMA = load_schema("application_create_schema")
-APPLICATION_UPDATE_SCHEMA = load_schema("application_update_schema")
+    schema = load_schema(schema_name)
+    globals()[name] = schema
+    return schema
@@ -1,34 +1,53 @@
 import httpx
-import os
+import logging
 from models.context.httpxcontext import HttpxContext
 from models.dto.application_request import ApplicationCreateDTO , ApplicationUpdateDTO
 from utility import logprovider
 from mcp.types import Tool, TextContent
 from models.handler.base_tool_handler import BaseToolHandler
-from typing import List, Any, Dict, Optional
-import uuid
-from datetime import datetime, timezone
+from typing import List, Any, Callable, Dict, Optional, Tuple
 from mcp.server.fastmcp import Context
 from mcp.server.session import ServerSession
 from components.tools.schemas import APPLICATION_CREATE_SCHEMA, APPLICATION_UPDATE_SCHEMA
-from common import with_retry, with_circuit_breaker, CircuitBreakerError
-import json
+from common import with_retry, get_breaker_for_host, CircuitBreaker, Bulkhead, new_correlation_id, current_correlation_id, dumps_json
 
 logger = logprovider.get_logger()
 
-# Default configuration fallback (used if context doesn't provide config)
-# DEFAULT_UMR_CONFIG = {
-#     'URL': os.environ.get('UMR_SERVICE_URL', 'http://localhost:5138'),
-#     'MAX_RETRIES': int(os.environ.get('UMR_MAX_RETRIES', '3')),
-#     'RETRY_BACKOFF_FACTOR': float(os.environ.get('UMR_RETRY_BACKOFF', '0.5')),
-#     'STATUS_FORCELIST': [500, 502, 503, 504]
-# }
 
 class UserApplicationTool(BaseToolHandler):
     """A tool handler for user application management."""
 
+    # Retry-wrapped request functions keyed by (id(umr_config), function); the config is
+    # kept alongside so a recycled id never returns a function built for another config
+    _retry_cache: Dict[Tuple[int, str], Tuple[Dict[str, Any], Callable]] = {}
+    # (umr_config, register URL, service base URL) keyed by id(umr_config), parsed once
+    _url_cache: Dict[int, Tuple[Dict[str, Any], httpx.URL, httpx.URL]] = {}
+    # Concurrency limit on UMR calls, shared by every instance using the same config
+    _bulkhead_cache: Dict[int, Tuple[Dict[str, Any], Bulkhead]] = {}
+
     def __init__(self, correlation_id: Optional[str] = None):
-        self.correlation_id = correlation_id or str(uuid.uuid4())
+        self._corr = correlation_id or None
+
+    @property
+    def correlation_id(self) -> str:
+        """Correlation id of the current request, else this instance's id (generated on first use)."""
+        corr = current_correlation_id.get()
+        if corr is not None:
+            return corr
+        corr = self._corr
+        if corr is None:
+            corr = self._corr = new_correlation_id()
+        return corr
+
+    @property
+    def _log_extra(self) -> Dict[str, str]:
+        """Log record fields carrying the current correlation id."""
+        return {'correlation_id': self.correlation_id}
+
+    @property
+    def _base_headers(self) -> Dict[str, str]:
+        """Headers for a UMR request, carrying the current correlation id."""
+        return {'Content-Type': 'application/json', 'X-Correlation-ID': self.correlation_id}
 
     @property
     def tools(self) -> List[Tool]:
@@ -79,34 +98,111 @@ class UserApplicationTool(BaseToolHandler):
             app_data = input_data.get("application")
             
             # Parse app_data to ApplicationCreateDTO
-            application_obj = ApplicationCreateDTO(**app_data)
+            application_obj = ApplicationCreateDTO.model_validate(app_data)
             
             result = await self._handle_user_application(application_obj, ctx)
-            return [TextContent(type="text", text=json.dumps(result, default=str))]
+            return [TextContent(type="text", text=dumps_json(result))]
         elif tool_name == "application_status_update":
             app_data = input_data.get("application")
             
             # Parse app_data to ApplicationUpdateDTO
-            application_obj = ApplicationUpdateDTO(**app_data)
+            application_obj = ApplicationUpdateDTO.model_validate(app_data)
             
             result = await self._handle_application_update(application_obj, ctx)
-            return [TextContent(type="text", text=json.dumps(result, default=str))]
+            return [TextContent(type="text", text=dumps_json(result))]
         else:
             raise ValueError(f"Unknown tool: {tool_name}")
 
-    def _get_retry_config(self, umr_config: Dict[str, Any]) -> tuple[int, float, list]:
+    def _get_retry_config(self, umr_config: Dict[str, Any]) -> tuple[int, float, list, float, int]:
         """Extract retry configuration parameters from UMR config.
         
         Args:
             umr_config: UMR service configuration
             
         Returns:
-            Tuple of (max_retries, backoff_factor, status_forcelist)
+            Tuple of (max_retries, backoff_factor, status_forcelist, max_delay, retry_budget)
         """
         max_retries = umr_config.get('MAX_RETRIES', 3)
         backoff_factor = umr_config.get('RETRY_BACKOFF_FACTOR', 0.5)
         status_forcelist = umr_config.get('STATUS_FORCELIST', [500, 502, 503, 504])
-        return max_retries, backoff_factor, status_forcelist
+        max_delay = umr_config.get('MAX_BACKOFF_DELAY', 10.0)
+        retry_budget = umr_config.get('RETRY_BUDGET_PER_MINUTE', 30)
+        return max_retries, backoff_factor, status_forcelist, max_delay, retry_budget
+
+    def _retry_func_for(self, umr_config: Dict[str, Any], func: Callable) -> Callable:
+        """Return func wrapped with the retry policy from umr_config, built once per config.
+        
+        Args:
+            umr_config: UMR service configuration
+            func: Unbound request method to wrap (called with self as first argument)
+            
+        Returns:
+            Retry-wrapped function taking the same arguments as func
+        """
+        key = (id(umr_config), func.__qualname__)
+        entry = UserApplicationTool._retry_cache.get(key)
+        if entry is None or entry[0] is not umr_config:
+            max_retries, backoff_factor, status_forcelist, max_delay, retry_budget = self._get_retry_config(umr_config)
+            retry_func = with_retry(
+                max_retries=max_retries,
+                backoff_factor=backoff_factor,
+                status_forcelist=status_forcelist,
+                max_delay=max_delay,
+                retry_budget=retry_budget
+            )(func)
+            entry = UserApplicationTool._retry_cache[key] = (umr_config, retry_func)
+        return entry[1]
+
+    def _urls_for(self, umr_config: Dict[str, Any]) -> Tuple[httpx.URL, httpx.URL]:
+        """Return the parsed UMR register URL and service base URL, built once per config.
+        
+        Args:
+            umr_config: UMR service configuration
+            
+        Returns:
+            Tuple of (register_url, base_url); base_url ends with "/" so relative paths join onto it
+        """
+        entry = UserApplicationTool._url_cache.get(id(umr_config))
+        if entry is None or entry[0] is not umr_config:
+            base_url = httpx.URL(umr_config.get('URL', 'http://localhost:5138').rstrip('/') + '/')
+            entry = (umr_config, base_url.join("api/application/v1/register"), base_url)
+            UserApplicationTool._url_cache[id(umr_config)] = entry
+        return entry[1], entry[2]
+
+    def _breaker_for(self, umr_config: Dict[str, Any]) -> CircuitBreaker:
+        """Return the circuit breaker shared by all calls to the configured UMR host.
+        
+        Args:
+            umr_config: UMR service configuration
+            
+        Returns:
+            CircuitBreaker registered for the UMR host and port
+        """
+        _, base_url = self._urls_for(umr_config)
+        return get_breaker_for_host(
+            base_url.netloc.decode("ascii"),
+            failure_threshold=5,
+            recovery_timeout=60
+        )
+
+    def _bulkhead_for(self, umr_config: Dict[str, Any]) -> Bulkhead:
+        """Return the bulkhead bounding concurrent UMR calls, built once per config.
+        
+        Args:
+            umr_config: UMR service configuration
+            
+        Returns:
+            Bulkhead sized by BULKHEAD_CAPACITY with BULKHEAD_TIMEOUT acquire timeout
+        """
+        entry = UserApplicationTool._bulkhead_cache.get(id(umr_config))
+        if entry is None or entry[0] is not umr_config:
+            bulkhead = Bulkhead(
+                capacity=umr_config.get('BULKHEAD_CAPACITY', 50),
+                acquire_timeout=umr_config.get('BULKHEAD_TIMEOUT', 5.0),
+                name="UMR_Service"
+            )
+            entry = UserApplicationTool._bulkhead_cache[id(umr_config)] = (umr_config, bulkhead)
+        return entry[1]
 
     async def _handle_user_application(self, application: ApplicationCreateDTO, ctx: Context[ServerSession, HttpxContext]) -> Dict[str, Any]:
         """Handle user application logic."""
@@ -116,17 +212,12 @@ class UserApplicationTool(BaseToolHandler):
         if not umr_config:
             raise ValueError("UMR configuration is missing in context")
 
-        logger.info(f"Handling user application with input: {application.model_dump()}")
+        # Pydantic's repr is formatted only when the record is emitted
+        logger.info("Handling user application with input: %r", application, extra=self._log_extra)
         
         # Register application with UMR service
-        result = await self._do_register_application(client, application, umr_config)
-        return result
+        return await self._do_register_application(client, application, umr_config)
     
-    @with_circuit_breaker(
-        failure_threshold=5,
-        recovery_timeout=60,
-        name="UMR_Application_Registration"
-    )
     async def _do_register_application(self, client: httpx.AsyncClient, application: ApplicationCreateDTO, umr_config: Dict[str, Any]) -> Dict[str, Any]:
         """
         Internal registration method with circuit breaker and retry logic.
@@ -139,17 +230,11 @@ class UserApplicationTool(BaseToolHandler):
         Returns:
             Dict containing the registration response
         """
-        # Apply retry with config-driven parameters
-        max_retries, backoff_factor, status_forcelist = self._get_retry_config(umr_config)
-        
-        # Wrap in retry decorator
-        retry_func = with_retry(
-            max_retries=max_retries,
-            backoff_factor=backoff_factor,
-            status_forcelist=status_forcelist
-        )(self._execute_registration)
+        # Apply retry with config-driven parameters, wrapped once per config
+        retry_func = self._retry_func_for(umr_config, type(self)._execute_registration)
         
-        return await retry_func(client, application, umr_config)
+        # Retries run inside the breaker shared by every call to the UMR host
+        return await self._breaker_for(umr_config).call(retry_func, self, client, application, umr_config)
     
     async def _execute_registration(self, client: httpx.AsyncClient, application: ApplicationCreateDTO, umr_config: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -163,33 +248,32 @@ class UserApplicationTool(BaseToolHandler):
         Returns:
             Dict containing the registration response
         """
-        url = f"{umr_config.get('URL', 'http://localhost:5138')}/api/application/v1/register"
+        url, _ = self._urls_for(umr_config)
         
-        # Prepare request payload
-        payload = application.model_dump()
+        # Serialize the request body once, in pydantic-core
+        body = application.model_dump_json().encode()
         
-        # Add correlation ID for tracking
-        headers = {
-            'Content-Type': 'application/json',
-            'X-Correlation-ID': self.correlation_id
-        }
+        # Base headers carry the correlation ID for tracking
+        headers = self._base_headers
         
-        logger.info(f"Registering application with UMR service at {url}")
-        logger.debug(f"Request payload: {json.dumps(payload, default=str)}")
+        logger.info("Registering application with UMR service at %s", url, extra=self._log_extra)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Request payload: %s", body, extra=self._log_extra)
         
         # Make POST request
-        response = await client.post(
-            url,
-            json=payload,
-            headers=headers
-        )
+        async with self._bulkhead_for(umr_config):
+            response = await client.post(
+                url,
+                content=body,
+                headers=headers
+            )
         
         # Raise for error status codes
         response.raise_for_status()
         
         # Parse and return response
         if response.status_code == 201:
-            logger.info(f"Application registered successfully: {response.headers.get('Location', '')}")
+            logger.info("Application registered successfully: %s", response.headers.get('Location', ''), extra=self._log_extra)
         
         return {
             "status": response.status_code,
@@ -205,17 +289,12 @@ class UserApplicationTool(BaseToolHandler):
         if not umr_config:
             raise ValueError("UMR configuration is missing in context")
 
-        logger.info(f"Handling application update with input: {application.model_dump()}")
+        # Pydantic's repr is formatted only when the record is emitted
+        logger.info("Handling application update with input: %r", application, extra=self._log_extra)
         
         # Update application with UMR service
-        result = await self._do_update_application(client, application, umr_config)
-        return result
+        return await self._do_update_application(client, application, umr_config)
     
-    @with_circuit_breaker(
-        failure_threshold=5,
-        recovery_timeout=60,
-        name="UMR_Application_Update"
-    )
     async def _do_update_application(self, client: httpx.AsyncClient, application: ApplicationUpdateDTO, umr_config: Dict[str, Any]) -> Dict[str, Any]:
         """
         Internal update method with circuit breaker and retry logic.
@@ -228,17 +307,11 @@ class UserApplicationTool(BaseToolHandler):
         Returns:
             Dict containing the update response
         """
-        # Apply retry with config-driven parameters
-        max_retries, backoff_factor, status_forcelist = self._get_retry_config(umr_config)
-        
-        # Wrap in retry decorator
-        retry_func = with_retry(
-            max_retries=max_retries,
-            backoff_factor=backoff_factor,
-            status_forcelist=status_forcelist
-        )(self._execute_update)
+        # Apply retry with config-driven parameters, wrapped once per config
+        retry_func = self._retry_func_for(umr_config, type(self)._execute_update)
         
-        return await retry_func(client, application, umr_config)
+        # Retries run inside the breaker shared by every call to the UMR host
+        return await self._breaker_for(umr_config).call(retry_func, self, client, application, umr_config)
     
     async def _execute_update(self, client: httpx.AsyncClient, application: ApplicationUpdateDTO, umr_config: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -252,41 +325,33 @@ class UserApplicationTool(BaseToolHandler):
         Returns:
             Dict containing the update response
         """
-        url = f"{umr_config.get('URL', 'http://localhost:5138')}/api/application/v1/{application.applicationId}/status"
+        _, base_url = self._urls_for(umr_config)
+        url = base_url.join(f"api/application/v1/{application.applicationId}/status")
         
-        # Prepare request payload - only status fields
-        payload = {
-            "status": application.status,
-            "StatusChangedDate": application.statusChangedDate,
-            "notes": application.notes
-        }
-        
-        # Remove None values from payload
-        payload = {k: v for k, v in payload.items() if v is not None}
+        # Prepare request payload - only the status fields that are set
+        body = application.to_status_payload_json()
         
-        # Add correlation ID and user ID to headers
-        headers = {
-            'Content-Type': 'application/json',
-            'X-Correlation-ID': self.correlation_id,
-            'X-User-Id': str(application.userId)
-        }
+        # Add user ID to the base headers (correlation ID and content type)
+        headers = {**self._base_headers, 'X-User-Id': str(application.userId)}
         
-        logger.info(f"Updating application status at {url}")
-        logger.debug(f"Request payload: {json.dumps(payload, default=str)}")
+        logger.info("Updating application status at %s", url, extra=self._log_extra)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Request payload: %s", body, extra=self._log_extra)
         
         # Make PUT request
-        response = await client.put(
-            url,
-            json=payload,
-            headers=headers
-        )
+        async with self._bulkhead_for(umr_config):
+            response = await client.put(
+                url,
+                content=body,
+                headers=headers
+            )
         
         # Raise for error status codes
         response.raise_for_status()
         
         # Parse and return response
         if response.status_code == 204:
-            logger.info(f"Application status updated successfully for application ID: {application.applicationId}")
+            logger.info("Application status updated successfully for application ID: %s", application.applicationId, extra=self._log_extra)
         
         return {
             "status": response.status_code,
@@ -1,5 +1,4 @@
 
-from dataclasses import dataclass
 from pymongo import AsyncMongoClient
 from typing import List, Type
 from beanie import init_beanie, Document
@@ -36,9 +35,11 @@ async def initialize_beanie(
         raise
 
 
-@dataclass
 class DbContext:
     """Database context holding MongoDB client and database references."""
+    
+    __slots__ = ('client', 'db')
+    
     def __init__(self, client: AsyncMongoClient, db_name: str):
         self.client = client
         self.db = client[db_name]
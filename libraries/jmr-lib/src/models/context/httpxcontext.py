@@ -1,17 +1,34 @@
-from dataclasses import dataclass
-from collections.abc import AsyncIterator
-from contextlib import asynccontextmanager
-from typing import Optional, Dict, Any
+from types import MappingProxyType
+from typing import Dict, Any, Mapping
 import httpx
-from mcp.server.fastmcp import FastMCP
 
 
-@dataclass
+# Pool sizing for the default client: one long-lived pool shared by every tool call
+DEFAULT_LIMITS = httpx.Limits(max_connections=1000, max_keepalive_connections=100, keepalive_expiry=30.0)
+DEFAULT_TIMEOUT = httpx.Timeout(connect=5.0, read=30.0, write=10.0, pool=5.0)
+
+# Shared read-only service config used when none is supplied
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+
 class HttpxContext:
     """HTTP context holding HTTP client session and service configurations."""
     
+    __slots__ = ('http_client', 'umr_config', '_owns_client')
+    
     def __init__(self, http_client: httpx.AsyncClient | None = None, umr_config: Dict[str, Any] | None = None):
-        self.http_client = http_client
-        self.umr_config = umr_config or {}
+        # Only a client created here is owned (and closed) by the context
+        self._owns_client = http_client is None
+        self.http_client = http_client if http_client is not None else httpx.AsyncClient(
+            limits=DEFAULT_LIMITS,
+            http2=True,
+            timeout=DEFAULT_TIMEOUT
+        )
+        self.umr_config = umr_config or _EMPTY
+    
+    async def aclose(self) -> None:
+        """Close the HTTP client if this context created it."""
+        if self._owns_client:
+            await self.http_client.aclose()
 
 
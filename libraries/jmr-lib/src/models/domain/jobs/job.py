@@ -2,9 +2,10 @@ from abc import ABC, abstractmethod
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
 from typing_extensions import Annotated
-from beanie import Document, Indexed
+from beanie import Document, Indexed, PydanticObjectId
 from beanie.operators import GTE, LTE, In, Or, And
-from pydantic import BaseModel, Field, computed_field
+from pydantic import BaseModel, Field
+from pymongo import IndexModel, DESCENDING
 from enum import Enum
 
 class View(BaseModel):
@@ -42,15 +43,59 @@ class Job(Document):
     posted_date: str
     skills: List[str]
     views: List[View] = Field(default=[])
+    # Denormalized len(views), set on insert and recomputed whenever a view is appended
+    view_count: Annotated[int, Indexed()] = 0
     source: str
     created_at: str
     updated_at: str
-    
-    @computed_field
-    @property
-    def view_count(self) -> int:
-        """Return the count of views instead of the full view data."""
-        return len(self.views) if self.views else 0
+
+    class Settings:
+        # job_id is already indexed (unique) through its Indexed annotation
+        indexes = [
+            IndexModel([("posted_date", DESCENDING)]),
+        ]
+
+class JobPublic(BaseModel):
+    """Projection of a job listing without the embedded views.
+
+    MongoDB strips `views` server-side and returns the stored `view_count`,
+    so listings never transfer or validate the individual View records.
+    """
+    id: Optional[PydanticObjectId] = Field(default=None, alias="_id")
+    job_id: str
+    title: str
+    description: str
+    company: str
+    location: str
+    job_type: JobType
+    connection_type: ConnectionType
+    salary_range: Dict[str, Any]
+    posted_date: str
+    skills: List[str]
+    source: str
+    created_at: str
+    updated_at: str
+    view_count: int = 0
+
+    class Settings:
+        projection = {
+            "_id": 1,
+            "job_id": 1,
+            "title": 1,
+            "description": 1,
+            "company": 1,
+            "location": 1,
+            "job_type": 1,
+            "connection_type": 1,
+            "salary_range": 1,
+            "posted_date": 1,
+            "skills": 1,
+            "source": 1,
+            "created_at": 1,
+            "updated_at": 1,
+            # Stored count, falling back to counting views for documents written before it existed
+            "view_count": {"$ifNull": ["$view_count", {"$size": {"$ifNull": ["$views", []]}}]},
+        }
 
 class JobFilter:
 
@@ -80,6 +125,20 @@ class JobFilter:
     
 class JobFilterHelpers():
 
+    # (JobFilter attribute, condition builder) pairs, evaluated in order for set attributes
+    _FIELD_BUILDERS = (
+        ('job_id', lambda value: Job.job_id == value),
+        ('company', lambda value: Job.company == value),
+        ('location', lambda value: Job.location == value),
+        ('job_type', lambda value: Job.job_type == value),
+        ('connection_type', lambda value: Job.connection_type == value),
+        # Match jobs that have all specified skills
+        ('skills', lambda value: In(Job.skills, value)),
+        # Date range queries using GTE and LTE operators
+        ('posted_from', lambda value: GTE(Job.posted_date, value)),
+        ('posted_to', lambda value: LTE(Job.posted_date, value)),
+    )
+
     def build_filter_query(self, job_filter: JobFilter):
         """
         Build a Beanie query using operators from the JobFilter object.
@@ -90,33 +149,11 @@ class JobFilterHelpers():
         Returns:
             Beanie query expression (And/Or) or None if no filters
         """
-        conditions = []
-
-        if job_filter.job_id:
-            conditions.append(Job.job_id == job_filter.job_id)
-        
-        if job_filter.company:
-            conditions.append(Job.company == job_filter.company)
-        
-        if job_filter.location:
-            conditions.append(Job.location == job_filter.location)
-        
-        if job_filter.job_type:
-            conditions.append(Job.job_type == job_filter.job_type)
-        
-        if job_filter.connection_type:
-            conditions.append(Job.connection_type == job_filter.connection_type)
-        
-        if job_filter.skills:
-            # Match jobs that have all specified skills
-            conditions.append(In(Job.skills, job_filter.skills))
-        
-        # Date range queries using GTE and LTE operators
-        if job_filter.posted_from:
-            conditions.append(GTE(Job.posted_date, job_filter.posted_from))
-        
-        if job_filter.posted_to:
-            conditions.append(LTE(Job.posted_date, job_filter.posted_to))
+        conditions = [
+            build(value)
+            for name, build in self._FIELD_BUILDERS
+            if (value := getattr(job_filter, name))
+        ]
         
         # Return None if no conditions
         if not conditions:
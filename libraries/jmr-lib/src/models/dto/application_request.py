@@ -1,9 +1,14 @@
 import pydantic 
 from typing import Dict, Any, Optional
 
+# Fields sent to UMR in an application status update
+_STATUS_PAYLOAD_FIELDS = {"status", "statusChangedDate", "notes"}
+
 class ApplicationCreateDTO(pydantic.BaseModel):
     """Data Transfer Object for user application requests."""
     
+    model_config = pydantic.ConfigDict(extra='ignore', frozen=True)
+    
     userId: str
     jobId: str
     status: str
@@ -13,8 +18,19 @@ class ApplicationCreateDTO(pydantic.BaseModel):
 class ApplicationUpdateDTO(pydantic.BaseModel):
     """Data Transfer Object for updating user application status."""
     
+    model_config = pydantic.ConfigDict(extra='ignore', frozen=True)
+    
     applicationId: int
     userId: int
     status: str
-    statusChangedDate: str
-    notes: Optional[str] = None
\ No newline at end of file
+    # UMR expects the status change date as "StatusChangedDate" in request bodies
+    statusChangedDate: str = pydantic.Field(serialization_alias="StatusChangedDate")
+    notes: Optional[str] = None
+    
+    def to_status_payload_json(self) -> bytes:
+        """Serialize the status fields that are set as the UMR status update JSON body."""
+        return self.model_dump_json(
+            include=_STATUS_PAYLOAD_FIELDS,
+            exclude_none=True,
+            by_alias=True
+        ).encode()
\ No newline at end of file
@@ -14,6 +14,8 @@ class BaseResourceHandler(ABC):
     - Resource Templates: Use 'uriTemplate' for dynamic URIs with parameters (e.g., "jobs://details/{job_id}")
     """
 
+    __slots__ = ()
+
     @property
     def direct_resources(self) -> List[Resource]:
         """Return direct resources with static URIs.
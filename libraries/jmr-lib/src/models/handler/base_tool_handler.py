@@ -5,6 +5,8 @@ from typing import Dict, List, Any
 class BaseToolHandler(ABC):
     """Base class that all tool handlers"""
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def tools(self) -> List[Tool]:
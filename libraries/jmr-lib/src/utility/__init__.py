@@ -1,5 +1,5 @@
-from .logprovider import get_logger
+from .logprovider import get_logger, log_span
 
 print("Load the logger module ...")
 
-__all__ = ['get_logger']
\ No newline at end of file
+__all__ = ['get_logger', 'log_span']
\ No newline at end of file
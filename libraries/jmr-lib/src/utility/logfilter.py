@@ -13,4 +13,11 @@ class ErrorFilter(logging.Filter):
 class WarningFilter(logging.Filter):
     def filter(self, record):
         # Allow only WARNING-level messages
-        return record.levelno == logging.WARNING
\ No newline at end of file
+        return record.levelno == logging.WARNING
+
+class CorrelationIdFilter(logging.Filter):
+    def filter(self, record):
+        # Default the correlation id for records logged without extra={"correlation_id": ...}
+        if not hasattr(record, 'correlation_id'):
+            record.correlation_id = '-'
+        return True
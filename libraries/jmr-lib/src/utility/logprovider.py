@@ -1,5 +1,8 @@
+from contextlib import contextmanager
 from logging import Logger
+from typing import Iterator, Optional
 import os
+import time
 import logging.config
 import yaml
 
@@ -11,6 +14,27 @@ def Setup(config_file):
 def get_logger() -> Logger:
      return logging.getLogger('core_logger')
 
+@contextmanager
+def log_span(operation: str, logger: Optional[Logger] = None, **fields) -> Iterator[None]:
+    """
+    Log one completion (or failure) entry for an operation instead of separate start/end lines.
+    
+    Args:
+        operation: Name of the operation being logged
+        logger: Logger to emit on (defaults to the core logger)
+        **fields: Structured fields attached to the record via extra (e.g. correlation_id)
+    """
+    log = logger or get_logger()
+    start = time.perf_counter()
+    try:
+        yield
+    except Exception as e:
+        log.error("%s failed: %s: %s", operation, type(e).__name__, e, extra=fields)
+        raise
+    else:
+        if log.isEnabledFor(logging.INFO):
+            log.info("Completed %s in %.1fms", operation, (time.perf_counter() - start) * 1000, extra=fields)
+
 # get path of the script folder
 script_dir = os.path.dirname(os.path.abspath(__file__))
 print(f"Script dir: {script_dir}")
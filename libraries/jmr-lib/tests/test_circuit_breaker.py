@@ -0,0 +1,48 @@
+"""Tests for the circuit breaker decorator."""
+import asyncio
+
+import httpx
+
+from common import CircuitState, with_circuit_breaker
+
+
+def test_non_consecutive_failures_keep_circuit_closed():
+    """A success between failures resets the count, so the breaker never trips."""
+    outcomes = iter([False, True] * 10)
+
+    @with_circuit_breaker(failure_threshold=3, recovery_timeout=60, name="test.non_consecutive")
+    async def call():
+        if not next(outcomes):
+            raise httpx.ConnectError("connection refused")
+        return "ok"
+
+    async def run():
+        for _ in range(10):
+            try:
+                await call()
+            except httpx.ConnectError:
+                pass
+            await call()
+
+    asyncio.run(run())
+
+    assert call.circuit_breaker.state is CircuitState.CLOSED
+    assert call.circuit_breaker.failure_count == 0
+
+
+def test_consecutive_failures_open_circuit():
+    """Reaching the threshold with consecutive failures opens the circuit."""
+    @with_circuit_breaker(failure_threshold=3, recovery_timeout=60, name="test.consecutive")
+    async def call():
+        raise httpx.ConnectError("connection refused")
+
+    async def run():
+        for _ in range(3):
+            try:
+                await call()
+            except httpx.ConnectError:
+                pass
+
+    asyncio.run(run())
+
+    assert call.circuit_breaker.state is CircuitState.OPEN
@@ -0,0 +1,27 @@
+"""Tests for the job listing tool."""
+import asyncio
+from types import SimpleNamespace
+
+from components.tools.job_listing import JobListingTool
+from models.domain.jobs.job import View
+
+
+class _FakeJob(SimpleNamespace):
+    """Stand-in for a Job document that records its state at insert time."""
+
+    async def insert(self):
+        self.inserted_view_count = self.view_count
+
+
+def test_create_job_listing_counts_supplied_views():
+    """A job created with views is inserted with view_count equal to len(views)."""
+    views = [
+        View(user_id="user-1", view_date="2026-01-23T10:30:00+00:00"),
+        View(user_id="user-2", view_date="2026-01-23T10:31:00+00:00"),
+    ]
+    job = _FakeJob(id=None, title="Nurse", company="Carevo", views=views, view_count=0)
+
+    result = asyncio.run(JobListingTool("test").create_job_listing(job, ctx=None))
+
+    assert result.view_count == 2
+    assert job.inserted_view_count == 2
@@ -0,0 +1,37 @@
+"""Configuration for the development environment."""
+from types import MappingProxyType
+from helpers.secret_manager import batch_get_secrets
+
+# Secrets Manager ARNs
+DEV_SECRET_ARN = ''  # To be added later
+
+secrets = batch_get_secrets([DEV_SECRET_ARN]).get(DEV_SECRET_ARN, {})
+dev_password = secrets.get('MONGO_PASSWORD', '') if secrets else ''
+
+config = MappingProxyType({
+    'MONGO_URI': 'dev-db.example.com:27017',
+    'MONGO_USERNAME': 'dev_user',
+    'MONGO_PASSWORD': f'{dev_password}',
+    'MONGO_DB': 'jmr',
+    'MONGO_VERIFY_STARTUP': True,
+    'MONGO_SETTINGS': MappingProxyType({
+        'maxPoolSize': 200,
+        'minPoolSize': 10,
+        'maxIdleTimeMS': 300000,
+        'waitQueueTimeoutMS': 2000,
+        'compressors': 'zstd,snappy'
+    }),
+    'API_ENDPOINT': 'http://localhost:8000',
+    'MCP_TRANSPORT': 'streamable-http',
+    'ORIGINS': ('http://localhost:3000', 'http://localhost:8000'),
+    'HTTPX_SETTINGS': MappingProxyType({
+        'max_connections': 50,
+        'max_keepalive_connections': 10,
+        'keepalive_expiry': 60.0,
+        'http2': True,
+        'timeout': 30.0,
+        'connect_timeout': 10.0,
+        'follow_redirects': True,
+        'verify': False
+    })
+})
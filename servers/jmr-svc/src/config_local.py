@@ -0,0 +1,40 @@
+"""Configuration for the local environment."""
+from types import MappingProxyType
+
+config = MappingProxyType({
+    'MONGO_URI': 'localhost:27017',
+    'MONGO_USERNAME': 'admin',
+    'MONGO_PASSWORD': '$ccat0.Nest',
+    'MONGO_DB': 'jmr',
+    'MONGO_VERIFY_STARTUP': False,
+    'MONGO_SETTINGS': MappingProxyType({
+        'maxPoolSize': 200,
+        'minPoolSize': 10,
+        'maxIdleTimeMS': 300000,
+        'waitQueueTimeoutMS': 2000,
+        'compressors': 'zstd,snappy'
+    }),
+    'API_ENDPOINT': 'localhost',
+    'MCP_TRANSPORT': 'streamable-http',
+    'ORIGINS': ('*',),
+    'HTTPX_SETTINGS': MappingProxyType({
+        'max_connections': 50,
+        'max_keepalive_connections': 10,
+        'keepalive_expiry': 60.0,
+        'http2': False,
+        'timeout': 30.0,
+        'connect_timeout': 10.0,
+        'follow_redirects': True,
+        'verify': False
+    }),
+    "UMR_SERVICE": MappingProxyType({
+        "URL": "http://localhost:5138" ,
+        "MAX_RETRIES": 3,
+        "RETRY_BACKOFF_FACTOR": 0.5,
+        "STATUS_FORCELIST": frozenset({500, 502, 503, 504}),
+        "MAX_BACKOFF_DELAY": 10.0,
+        "RETRY_BUDGET_PER_MINUTE": 30,
+        "BULKHEAD_CAPACITY": 50,
+        "BULKHEAD_TIMEOUT": 5.0
+    })
+})
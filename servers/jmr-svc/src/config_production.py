@@ -0,0 +1,37 @@
+"""Configuration for the production environment."""
+from types import MappingProxyType
+from helpers.secret_manager import batch_get_secrets
+
+# Secrets Manager ARNs
+PROD_SECRET_ARN = ''  # To be added later
+
+secrets = batch_get_secrets([PROD_SECRET_ARN]).get(PROD_SECRET_ARN, {})
+prod_password = secrets.get('MONGO_PASSWORD', '') if secrets else ''
+
+config = MappingProxyType({
+    'MONGO_URI': 'prod-db.example.com:27017',
+    'MONGO_USERNAME': 'prod_user',
+    'MONGO_PASSWORD': f'{prod_password}',
+    'MONGO_DB': 'jmr',
+    'MONGO_VERIFY_STARTUP': True,
+    'MONGO_SETTINGS': MappingProxyType({
+        'maxPoolSize': 200,
+        'minPoolSize': 10,
+        'maxIdleTimeMS': 300000,
+        'waitQueueTimeoutMS': 2000,
+        'compressors': 'zstd,snappy'
+    }),
+    'API_ENDPOINT': 'https://api.mcpdomain.com',
+    'MCP_TRANSPORT': 'https',
+    'ORIGINS': ('https://app.domain.com', 'https://api.mcpdomain.com'),
+    'HTTPX_SETTINGS': MappingProxyType({
+        'max_connections': 1000,
+        'max_keepalive_connections': 100,
+        'keepalive_expiry': 60.0,
+        'http2': True,
+        'timeout': 60.0,
+        'connect_timeout': 15.0,
+        'follow_redirects': True,
+        'verify': True
+    })
+})
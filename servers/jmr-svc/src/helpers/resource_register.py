@@ -2,71 +2,120 @@ from utility import logprovider
 from mcp.server.fastmcp import FastMCP, Context
 from mcp.types import Resource, ResourceTemplate, TextContent
 from models.handler.base_resource_handler import BaseResourceHandler
-from typing import List, Any, Dict, Optional
+from typing import List, Any, Dict, Mapping, Optional, Pattern, Set, Tuple
+from types import MappingProxyType
+from functools import lru_cache
+import inspect
 import re
+from collections import OrderedDict, defaultdict
+
+
+def _static_prefix(uri_template: str) -> Optional[str]:
+    """Return the template's leading static path (up to the last '/' before the first parameter), or None if it has none."""
+    head, sep, _ = uri_template.partition('{')
+    if not sep:
+        return None
+    end = head.rfind('/')
+    return head[:end] if end > 0 else None
+
+
+# Signature presented to FastMCP for direct resources, hiding the default-bound wrapper arguments
+_NO_PARAMS_SIGNATURE = inspect.Signature(return_annotation=str)
+
+
+@lru_cache(maxsize=256)
+def _build_signature(param_names: Tuple[str, ...]) -> inspect.Signature:
+    """Return the wrapper signature for a template's parameters, built once per parameter shape."""
+    params = [
+        inspect.Parameter(name_param, inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=str)
+        for name_param in param_names
+    ]
+    return inspect.Signature(params, return_annotation=str)
+
+
+@lru_cache(maxsize=256)
+def _build_annotations(param_names: Tuple[str, ...]) -> Mapping[str, type]:
+    """Return read-only wrapper annotations for a template's parameters; copy before assigning."""
+    annotations = {name_param: str for name_param in param_names}
+    annotations['return'] = str
+    return MappingProxyType(annotations)
+
 
 class ResourceRegister:
     """Resource helper to attach resources to a server."""
     
+    # Maximum number of resolved template URIs remembered by get_handler_for_resource
+    LOOKUP_CACHE_SIZE = 1024
+    
     def __init__(self, server: FastMCP):
         self.server = server
         self.logger = logprovider.get_logger()
         self.resource_handlers: Dict[str, BaseResourceHandler] = {}
         self.direct_resources_registry: Dict[str, str] = {}  # Maps direct resource URI to handler name
         self.template_resources_registry: Dict[str, str] = {}  # Maps template URI to handler name
-        self.uri_patterns: Dict[str, tuple] = {}  # Maps regex patterns to (template_uri, handler)
+        self.uri_patterns: Dict[Pattern[str], Tuple[str, BaseResourceHandler]] = {}  # Maps compiled patterns to (template_uri, handler)
+        self._prefix_index: Dict[str, List[Tuple[Pattern[str], BaseResourceHandler]]] = defaultdict(list)  # Static template prefix to its patterns
+        self._unindexed_patterns: List[Tuple[Pattern[str], BaseResourceHandler]] = []  # Patterns without a static prefix
+        self._template_patterns: Dict[str, Pattern[str]] = {}  # Maps template URI to its compiled pattern
+        self._handler_to_uris: Dict[str, Set[str]] = defaultdict(set)  # Maps handler name to its resource URIs
+        self._wrapper_refs: List[Any] = []  # Registered wrappers, kept alive for the server's lifetime
+        self._lookup_cache: "OrderedDict[str, BaseResourceHandler]" = OrderedDict()  # LRU of resolved template URIs
     
     def register_handler(self, handler_name: str, handler: BaseResourceHandler):
         """Register a resource handler with the manager."""
         self.resource_handlers[handler_name] = handler
+        # New templates may change which handler a URI resolves to
+        self._lookup_cache.clear()
+        
+        direct_resources = getattr(handler, 'direct_resources', ())
+        resource_templates = getattr(handler, 'resource_templates', ())
+        handler_uris = self._handler_to_uris[handler_name]
         
         # Register direct resources (static URIs)
-        if hasattr(handler, 'direct_resources'):
-            for resource in handler.direct_resources:
-                uri_str = str(resource.uri)
-                self.direct_resources_registry[uri_str] = handler_name
-                self._register_direct_resource(resource, handler)
+        for resource in direct_resources:
+            uri_str = str(resource.uri)
+            self.direct_resources_registry[uri_str] = handler_name
+            handler_uris.add(uri_str)
+            self._register_direct_resource(resource, handler, uri_str)
         
         # Register resource templates (dynamic URIs with parameters)
-        if hasattr(handler, 'resource_templates'):
-            for resource in handler.resource_templates:
-                uri_str = str(resource.uriTemplate)
-                self.template_resources_registry[uri_str] = handler_name
-                self._register_resource_template(resource, handler)
-        
-        total_resources = len(getattr(handler, 'direct_resources', [])) + len(getattr(handler, 'resource_templates', []))
-        self.logger.info(f"Registered handler '{handler_name}' with {total_resources} resources ({len(getattr(handler, 'direct_resources', []))} direct, {len(getattr(handler, 'resource_templates', []))} templates)")
+        for resource in resource_templates:
+            uri_str = str(resource.uriTemplate)
+            self.template_resources_registry[uri_str] = handler_name
+            handler_uris.add(uri_str)
+            self._register_resource_template(resource, handler, uri_str)
+        
+        direct_count = len(direct_resources)
+        template_count = len(resource_templates)
+        self.logger.info(f"Registered handler '{handler_name}' with {direct_count + template_count} resources ({direct_count} direct, {template_count} templates)")
     
-    def _register_direct_resource(self, resource: Resource, handler: BaseResourceHandler):
+    def _register_direct_resource(self, resource: Resource, handler: BaseResourceHandler, uri_str: str):
         """Register a direct resource (static URI) with the FastMCP server."""
-        uri_str = str(resource.uri)
         description = resource.description or ""
         name = resource.name or uri_str
         
-        # Static URI without parameters
-        async def resource_wrapper() -> str:
-            return await handler.read_resource(uri_str)
+        # Static URI without parameters; the handler method and URI are bound as defaults
+        async def resource_wrapper(_read=handler.read_resource, _uri=uri_str) -> str:
+            return await _read(_uri)
         
         # Set function name to the resource name
         resource_wrapper.__name__ = name
         
+        # FastMCP must see no parameters, or it would treat the resource as a template
+        resource_wrapper.__signature__ = _NO_PARAMS_SIGNATURE
+        
         resource_func = self.server.resource(uri_str, name=name, description=description)(resource_wrapper)
         
         # Store reference to avoid GC
-        attr_name = uri_str.replace("://", "_").replace("/", "_")
-        setattr(handler, f"_direct_{attr_name}_wrapper", resource_func)
+        self._wrapper_refs.append(resource_func)
     
-    def _register_resource_template(self, resource: ResourceTemplate, handler: BaseResourceHandler):
+    def _register_resource_template(self, resource: ResourceTemplate, handler: BaseResourceHandler, uri_str: str):
         """Register a resource template (dynamic URI with parameters) with the FastMCP server."""
-        import inspect
-        
-        # Convert AnyUrl to string
-        uri_str = str(resource.uriTemplate)
         description = resource.description or ""
         name = resource.name or uri_str
         
         # Extract parameter names from URI template
-        param_names = re.findall(r'\{(\w+)\}', uri_str)
+        param_names = tuple(re.findall(r'\{(\w+)\}', uri_str))
         
         # Create a regex pattern to match URIs against this template
         pattern = re.escape(uri_str)
@@ -75,35 +124,36 @@ class ResourceRegister:
             pattern = pattern.replace(re.escape(f"{{{param_name}}}"), f"(?P<{param_name}>[^/]+)")
         pattern = f"^{pattern}$"
         
-        # Store the pattern for URI matching
-        self.uri_patterns[pattern] = (uri_str, handler)
+        # Store the compiled pattern for URI matching, bucketed by its static prefix
+        compiled = re.compile(pattern)
+        self.uri_patterns[compiled] = (uri_str, handler)
+        self._template_patterns[uri_str] = compiled
+        prefix = _static_prefix(uri_str)
+        if prefix is None:
+            self._unindexed_patterns.append((compiled, handler))
+        else:
+            self._prefix_index[prefix].append((compiled, handler))
+        
+        # Compile the template into a format string once; literal braces are escaped
+        fmt = re.sub(r'\{\{(\w+)\}\}', r'{\1}', uri_str.replace('{', '{{').replace('}', '}}'))
         
         # Create wrapper with dynamic signature for parameterized resources
-        async def resource_wrapper(**kwargs) -> str:
-            actual_uri = uri_str
-            for param_name, param_value in kwargs.items():
-                actual_uri = actual_uri.replace(f"{{{param_name}}}", param_value)
-            return await handler.read_resource(actual_uri)
+        async def resource_wrapper(_fmt=fmt, _read=handler.read_resource, **kwargs) -> str:
+            return await _read(_fmt.format(**kwargs))
         
         # Set function name to the resource name
         resource_wrapper.__name__ = name
         
-        # Set the correct signature
-        params = [
-            inspect.Parameter(name_param, inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=str)
-            for name_param in param_names
-        ]
-        resource_wrapper.__signature__ = inspect.Signature(params, return_annotation=str)
+        # Set the correct signature, shared by templates with the same parameters
+        resource_wrapper.__signature__ = _build_signature(param_names)
         
         # Set annotations for Pydantic validation
-        resource_wrapper.__annotations__ = {name_param: str for name_param in param_names}
-        resource_wrapper.__annotations__['return'] = str
+        resource_wrapper.__annotations__ = _build_annotations(param_names).copy()
         
         resource_func = self.server.resource(uri_str, name=name, description=description)(resource_wrapper)
         
         # Store reference to avoid GC
-        attr_name = uri_str.replace("://", "_").replace("/", "_").replace("{", "").replace("}", "")
-        setattr(handler, f"_template_{attr_name}_wrapper", resource_func)
+        self._wrapper_refs.append(resource_func)
    
     def unregister_handler(self, handler_name: str):
         """Unregister a resource handler and all its resources."""
@@ -113,21 +163,37 @@ class ResourceRegister:
         
         handler = self.resource_handlers[handler_name]
         
-        # Remove direct resources from registry
-        direct_resources_to_remove = [uri for uri, h_name in self.direct_resources_registry.items() if h_name == handler_name]
-        for resource_uri in direct_resources_to_remove:
-            del self.direct_resources_registry[resource_uri]
-        
-        # Remove template resources from registry
-        template_resources_to_remove = [uri for uri, h_name in self.template_resources_registry.items() if h_name == handler_name]
-        for resource_uri in template_resources_to_remove:
-            del self.template_resources_registry[resource_uri]
+        # Remove only this handler's resources, found through the reverse index
+        direct_removed = 0
+        template_removed = 0
+        for resource_uri in self._handler_to_uris.pop(handler_name, ()):
+            if self.direct_resources_registry.get(resource_uri) == handler_name:
+                del self.direct_resources_registry[resource_uri]
+                direct_removed += 1
+            if self.template_resources_registry.get(resource_uri) == handler_name:
+                del self.template_resources_registry[resource_uri]
+                self._remove_template_pattern(resource_uri, handler)
+                template_removed += 1
         
         # Remove handler
         del self.resource_handlers[handler_name]
+        self._lookup_cache.clear()
+        
+        self.logger.info(f"Unregistered handler '{handler_name}' and {direct_removed + template_removed} resources ({direct_removed} direct, {template_removed} templates)")
+    
+    def _remove_template_pattern(self, uri_str: str, handler: BaseResourceHandler):
+        """Stop matching URIs against a template's pattern."""
+        compiled = self._template_patterns.pop(uri_str, None)
+        if compiled is None:
+            return
+        self.uri_patterns.pop(compiled, None)
         
-        total_removed = len(direct_resources_to_remove) + len(template_resources_to_remove)
-        self.logger.info(f"Unregistered handler '{handler_name}' and {total_removed} resources ({len(direct_resources_to_remove)} direct, {len(template_resources_to_remove)} templates)")
+        prefix = _static_prefix(uri_str)
+        bucket = self._unindexed_patterns if prefix is None else self._prefix_index.get(prefix)
+        if bucket is not None:
+            bucket[:] = [entry for entry in bucket if entry[0] is not compiled or entry[1] is not handler]
+            if prefix is not None and not bucket:
+                del self._prefix_index[prefix]
     
     def get_handler(self, handler_name: str) -> Optional[BaseResourceHandler]:
         """Get a registered resource handler by name."""
@@ -140,12 +206,43 @@ class ResourceRegister:
         if handler_name:
             return self.resource_handlers.get(handler_name)
         
-        # Then check template resources by pattern matching
-        for pattern, (template_uri, handler) in self.uri_patterns.items():
-            if re.match(pattern, uri):
+        # Then check recently resolved template URIs
+        lookup_cache = self._lookup_cache
+        handler = lookup_cache.get(uri)
+        if handler is not None:
+            lookup_cache.move_to_end(uri)
+            return handler
+        
+        handler = self._match_template(uri)
+        if handler is not None:
+            lookup_cache[uri] = handler
+            if len(lookup_cache) > self.LOOKUP_CACHE_SIZE:
+                lookup_cache.popitem(last=False)
+        return handler
+    
+    def _match_template(self, uri: str) -> Optional[BaseResourceHandler]:
+        """Find the handler whose template pattern matches the URI."""
+        # Check only the templates sharing one of the URI's static prefixes, longest first
+        prefix_index = self._prefix_index
+        end = len(uri)
+        while True:
+            end = uri.rfind('/', 0, end)
+            if end <= 0:
+                break
+            bucket = prefix_index.get(uri[:end])
+            if bucket:
+                for compiled, handler in bucket:
+                    if compiled.match(uri):
+                        return handler
+        
+        # Fall back to templates that have no static prefix
+        for compiled, handler in self._unindexed_patterns:
+            if compiled.match(uri):
                 return handler
         
         return None
+    
+    def list_handlers(self) -> List[str]:
         """List all registered handler names."""
         return list(self.resource_handlers.keys())
     
@@ -0,0 +1,54 @@
+"""AWS Secrets Manager helpers used by the environment configuration modules."""
+import json
+from functools import lru_cache
+from typing import Dict, List
+
+@lru_cache(maxsize=1)
+def _secrets_client():
+    """Return the process-wide Secrets Manager client, created on first use."""
+    # Imported lazily: boto3/botocore are slow to load and unused when no secret is fetched
+    import boto3
+    from botocore.config import Config
+    
+    return boto3.session.Session().client(
+        service_name='secretsmanager',
+        config=Config(max_pool_connections=10, tcp_keepalive=True)
+    )
+
+def batch_get_secrets(secret_arns: List[str]) -> Dict[str, dict]:
+    """
+    Retrieve several secrets from AWS Secrets Manager with BatchGetSecretValue.
+    
+    Args:
+        secret_arns: ARNs of the secrets to retrieve (empty entries are ignored)
+        
+    Returns:
+        dict: Parsed secret values keyed by ARN
+    """
+    arns = [arn for arn in dict.fromkeys(secret_arns) if arn]
+    if not arns:
+        return {}
+    
+    from botocore.exceptions import ClientError
+    
+    client = _secrets_client()
+    secrets = {}
+    request = {'SecretIdList': arns}
+    
+    while True:
+        response = client.batch_get_secret_value(**request)
+        for entry in response.get('SecretValues', []):
+            secrets[entry['ARN']] = json.loads(entry['SecretString'])
+        
+        errors = response.get('Errors')
+        if errors:
+            error = errors[0]
+            raise ClientError(
+                {'Error': {'Code': error.get('ErrorCode', ''), 'Message': error.get('Message', '')}},
+                'BatchGetSecretValue'
+            )
+        
+        next_token = response.get('NextToken')
+        if not next_token:
+            return secrets
+        request['NextToken'] = next_token
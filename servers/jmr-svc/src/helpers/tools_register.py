@@ -2,9 +2,58 @@ from utility import logprovider
 from mcp.server.fastmcp import FastMCP, Context
 from mcp.types import Tool, TextContent
 from models.handler.base_tool_handler import BaseToolHandler
-from typing import List, Any, Dict, Optional, get_origin, get_args
+from typing import List, Any, Dict, Optional, Set, Tuple
+from collections import defaultdict
+from functools import lru_cache
 import inspect
-import types
+# Annotations reused across tools instead of rebuilding typing objects per parameter
+_DICT_STR_ANY = Dict[str, Any]
+_LIST_ANY = List[Any]
+_SCALAR_TYPES: Dict[str, type] = {
+    "string": str,
+    "integer": int,
+    "number": float,
+    "boolean": bool,
+}
+
+# Hashable form of the type-relevant part of a JSON schema, e.g. ('array', ('string', None))
+SchemaKey = Tuple[str, Optional["SchemaKey"]]
+
+
+def _schema_key(schema: Dict[str, Any]) -> SchemaKey:
+    """Reduce a JSON schema to the hashable key its Python type depends on."""
+    json_type = schema.get("type", "string")
+    if not isinstance(json_type, str):
+        # Union types such as ["string", "null"] map to Any
+        return ("", None)
+    if json_type == "array":
+        items_schema = schema.get("items", {})
+        return (json_type, _schema_key(items_schema) if items_schema else None)
+    return (json_type, None)
+
+
+@lru_cache(maxsize=512)
+def _type_for_schema_key(key: SchemaKey) -> type:
+    """Convert a schema key to a Python type annotation, once per distinct key."""
+    json_type, items_key = key
+    if json_type == "object":
+        return _DICT_STR_ANY
+    if json_type == "array":
+        return List[_type_for_schema_key(items_key)] if items_key is not None else _LIST_ANY
+    return _SCALAR_TYPES.get(json_type, Any)
+
+
+@lru_cache(maxsize=256)
+def _build_signature(param_specs: Tuple[Tuple[str, Any, bool], ...]) -> inspect.Signature:
+    """Return the wrapper signature for (name, annotation, required) parameter specs, built once per shape."""
+    parameters = [
+        inspect.Parameter(name, inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=param_type)
+        if is_required else
+        inspect.Parameter(name, inspect.Parameter.POSITIONAL_OR_KEYWORD, default=None, annotation=param_type)
+        for name, param_type, is_required in param_specs
+    ]
+    return inspect.Signature(parameters)
+
 
 class ToolRegister:
     """ Tool helper to attach tools to a server."""
@@ -14,14 +63,18 @@ class ToolRegister:
         self.logger = logprovider.get_logger()
         self.tool_handlers: Dict[str, BaseToolHandler] = {}
         self.tools_registry: Dict[str, str] = {}
+        self._handler_to_tools: Dict[str, Set[str]] = defaultdict(set)  # Maps handler name to its tool names
+        self._wrapper_refs: List[Any] = []  # Registered wrappers, kept alive for the server's lifetime
     
     def register_handler(self, handler_name: str, handler: BaseToolHandler):
         """Register a tool handler with the manager."""
         self.tool_handlers[handler_name] = handler
         
         # Register all tools from the handler
+        handler_tools = self._handler_to_tools[handler_name]
         for tool in handler.tools:
             self.tools_registry[tool.name] = handler_name
+            handler_tools.add(tool.name)
             self._register_tool_with_server(tool, handler)
         
         self.logger.info(f"Registered handler '{handler_name}' with {len(handler.tools)} tools")
@@ -32,24 +85,13 @@ class ToolRegister:
         props = tool.inputSchema.get("properties", {}) if tool.inputSchema else {}
         required = set(tool.inputSchema.get("required", [])) if tool.inputSchema else set()
 
-        # Build parameter objects for inspect.Signature
+        # Build the signature from the tool's parameters, shared by tools with the same shape
         # ONLY include the tool's actual parameters, NOT ctx
-        parameters = []
-        
-        for name, schema in props.items():
+        sig = _build_signature(tuple(
             # Convert JSON schema type to Python type annotation
-            param_type = self._json_schema_to_python_type(schema)
-            
-            if name in required:
-                parameters.append(
-                    inspect.Parameter(name, inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=param_type)
-                )
-            else:
-                parameters.append(
-                    inspect.Parameter(name, inspect.Parameter.POSITIONAL_OR_KEYWORD, default=None, annotation=param_type)
-                )
-
-        sig = inspect.Signature(parameters)
+            (name, self._json_schema_to_python_type(schema), name in required)
+            for name, schema in props.items()
+        ))
 
         # Define a generic async function that receives ctx automatically from FastMCP
         # ctx is NOT in the signature - FastMCP injects it automatically
@@ -68,28 +110,11 @@ class ToolRegister:
         tool_wrapper = self.server.tool(tool.name, description=tool.description)(tool_wrapper)
 
         # Store reference to avoid GC
-        setattr(handler, f"_{tool.name}_wrapper", tool_wrapper)
+        self._wrapper_refs.append(tool_wrapper)
     
     def _json_schema_to_python_type(self, schema: Dict[str, Any]) -> type:
         """Convert JSON schema type to Python type annotation."""
-        json_type = schema.get("type", "string")
-        
-        if json_type == "object":
-            return Dict[str, Any]
-        elif json_type == "array":
-            items_schema = schema.get("items", {})
-            item_type = self._json_schema_to_python_type(items_schema) if items_schema else Any
-            return List[item_type]
-        elif json_type == "string":
-            return str
-        elif json_type == "integer":
-            return int
-        elif json_type == "number":
-            return float
-        elif json_type == "boolean":
-            return bool
-        else:
-            return Any
+        return _type_for_schema_key(_schema_key(schema))
 
     
     def unregister_handler(self, handler_name: str):
@@ -100,15 +125,17 @@ class ToolRegister:
         
         handler = self.tool_handlers[handler_name]
         
-        # Remove tools from registry
-        tools_to_remove = [name for name, h_name in self.tools_registry.items() if h_name == handler_name]
-        for tool_name in tools_to_remove:
-            del self.tools_registry[tool_name]
+        # Remove only this handler's tools, found through the reverse index
+        tools_removed = 0
+        for tool_name in self._handler_to_tools.pop(handler_name, ()):
+            if self.tools_registry.get(tool_name) == handler_name:
+                del self.tools_registry[tool_name]
+                tools_removed += 1
         
         # Remove handler
         del self.tool_handlers[handler_name]
         
-        self.logger.info(f"Unregistered handler '{handler_name}' and {len(tools_to_remove)} tools")
+        self.logger.info(f"Unregistered handler '{handler_name}' and {tools_removed} tools")
     
     def get_handler(self, handler_name: str) -> Optional[BaseToolHandler]:
         """Get a registered tool handler by name."""
@@ -1,15 +1,18 @@
+import os
 import uvicorn
-from config import config
-from mcp.server.fastmcp import FastMCP
+from config import config, env
 from services.health_check_service import health_mcp
 from services.job_management_service import job_listing_mcp, setup_joblisting_server
 from services.application_service import applications_mcp, setup_user_application_server
+from managers.shared_clients import close_http_client
+from managers.mongo_context import close_mongo_client
 import contextlib
 from starlette.applications import Starlette
 from starlette.routing import Mount
 from starlette.middleware.cors import CORSMiddleware
 
 from utility import logprovider
+from common import current_correlation_id, new_correlation_id
 
 logger = logprovider.get_logger()
 
@@ -18,6 +21,30 @@ jobsvc = job_listing_mcp
 appsvc = applications_mcp
 
 
+class CorrelationIdMiddleware:
+    """ASGI middleware exposing each request's X-Correlation-ID (or a new id) through current_correlation_id."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        corr = None
+        for name, value in scope["headers"]:
+            if name == b"x-correlation-id":
+                corr = value.decode("latin-1")
+                break
+
+        token = current_correlation_id.set(corr or new_correlation_id())
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            current_correlation_id.reset(token)
+
+
 @contextlib.asynccontextmanager
 async def lifespan(app: Starlette):
     async with contextlib.AsyncExitStack() as stack:
@@ -26,26 +53,38 @@ async def lifespan(app: Starlette):
         await stack.enter_async_context(healthsvc.session_manager.run())
         await stack.enter_async_context(jobsvc.session_manager.run())
         await stack.enter_async_context(appsvc.session_manager.run())
+        # Registered last so they run first on exit, before the session managers stop
+        stack.push_async_callback(close_mongo_client)
+        stack.push_async_callback(close_http_client)
         yield
 
 def serverOps() -> Starlette:
-    origins = config['ORIGINS']
+    origins, host = config['ORIGINS'], config['API_ENDPOINT']
     logger.info(f"Registering MCP streamable HTTP transport..")
-    host = config['API_ENDPOINT']
+
+    # Build each service's ASGI app exactly once
+    health_app = healthsvc.streamable_http_app()
+    job_app = jobsvc.streamable_http_app()
+    application_app = appsvc.streamable_http_app()
 
     app = Starlette(
         routes=[
-            Mount("/app", healthsvc.streamable_http_app()),
-            Mount("/job-listing", jobsvc.streamable_http_app()),
-            Mount("/user-application", appsvc.streamable_http_app()),
+            Mount("/app", health_app),
+            Mount("/job-listing", job_app),
+            Mount("/user-application", application_app),
         ],
         lifespan=lifespan,        
     )
 
+    # Tools and resources read the request's correlation id from the context variable
+    app = CorrelationIdMiddleware(app)
+
     app = CORSMiddleware(
         app,
-        allow_origins=origins,
+        # Starlette tests membership on every cross-origin request; a frozenset makes that O(1)
+        allow_origins=frozenset(origins),
         allow_methods=["GET", "POST", "PUT"],  # MCP streamable HTTP methods
+        allow_headers=["X-Correlation-ID"],
         expose_headers=["Mcp-Session-Id", "X-Request-Id"]
     )
 
@@ -54,6 +93,12 @@ def serverOps() -> Starlette:
 
 if __name__ == "__main__":
     logger.info(f"Registering MCP streamable HTTP transport..")
-    app =  serverOps()
-    uvicorn.run(app, host="127.0.0.1", port=8445)
+    # uvloop and httptools (shipped with uvicorn[standard]) move the event loop and HTTP parsing to C
+    if env == 'production':
+        # Multiple workers need an import string; each worker builds its own app via the factory
+        uvicorn.run("main:serverOps", factory=True, host="127.0.0.1", port=8445,
+                    loop="uvloop", http="httptools", workers=os.cpu_count() or 1)
+    else:
+        app =  serverOps()
+        uvicorn.run(app, host="127.0.0.1", port=8445, loop="uvloop", http="httptools")
     logger.info(f"Registered MCP services..")
@@ -1,4 +1,5 @@
-from .mongo_context import app_lifespan
+from .mongo_context import app_lifespan, close_mongo_client
 from .http_context import http_app_lifespan
+from .shared_clients import get_http_client, close_http_client
 
-__all__ = ['app_lifespan', 'http_app_lifespan']
+__all__ = ['app_lifespan', 'close_mongo_client', 'http_app_lifespan', 'get_http_client', 'close_http_client']
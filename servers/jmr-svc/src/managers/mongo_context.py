@@ -1,17 +1,48 @@
 from utility import logprovider
 from pymongo import AsyncMongoClient
 from pymongo.errors import ConnectionFailure, ServerSelectionTimeoutError
-from config import env_configs, env
+from config import config
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 from mcp.server.fastmcp import FastMCP
-from typing import Optional, List, Type
+import asyncio
+import time
+from dataclasses import dataclass
+from types import MappingProxyType
+from functools import lru_cache
+from typing import Any, Mapping, Optional, List, Tuple, Type
 from urllib.parse import quote_plus
 from models.context.dbcontext import DbContext, initialize_beanie
 from models.domain.jobs.job import Job
 
 logger = logprovider.get_logger()
 
+# Shared read-only default for missing config sections, instead of a new {} per lookup
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+
+@dataclass(frozen=True, slots=True)
+class MongoSettings:
+    """MongoDB connection settings for the current environment, resolved once at import."""
+    uri: Optional[str]
+    username: Optional[str]
+    password: Optional[str]
+    db: Optional[str]
+    verify_startup: bool
+    client_options: Mapping[str, Any]
+
+
+SETTINGS = MongoSettings(
+    uri=config.get('MONGO_URI'),
+    username=config.get('MONGO_USERNAME'),
+    password=config.get('MONGO_PASSWORD'),
+    db=config.get('MONGO_DB'),
+    # Round-trip to the server on lifespan start; off for local reloads against a known-good server
+    verify_startup=bool(config.get('MONGO_VERIFY_STARTUP', False)),
+    # Pool knobs (maxPoolSize, minPoolSize, maxIdleTimeMS, waitQueueTimeoutMS) passed to AsyncMongoClient
+    client_options=config.get('MONGO_SETTINGS', _EMPTY)
+)
+
 
 def build_mongo_connection_string(
     uri: str,
@@ -33,6 +64,13 @@ def build_mongo_connection_string(
     Returns:
         str: Fully formatted MongoDB connection string
     """
+    # Options are passed in call order so the same arguments always build the same string
+    return _build_cached(uri, username, password, db_name, tuple(kwargs.items()))
+
+
+@lru_cache(maxsize=16)
+def _build_cached(uri: str, username: str, password: str, db_name: str, options: Tuple[Tuple[str, Any], ...]) -> str:
+    """Build (once per distinct set of arguments) the connection string for build_mongo_connection_string."""
     # URL-encode username and password to handle special characters
     encoded_username = quote_plus(username)
     encoded_password = quote_plus(password)
@@ -41,54 +79,90 @@ def build_mongo_connection_string(
     connection_string = f"mongodb://{encoded_username}:{encoded_password}@{uri}/{db_name}"
     
     # Add optional parameters
-    if kwargs:
-        params = "&".join([f"{key}={value}" for key, value in kwargs.items()])
+    if options:
+        params = "&".join(f"{key}={value}" for key, value in options)
         connection_string += f"?{params}"
     
     return connection_string
 
 
-@asynccontextmanager
-async def app_lifespan(server: FastMCP) -> AsyncIterator[DbContext]:
-    """Manage application lifecycle with MongoDB connection."""
-    # Initialize on startup
-    config = env_configs.get(env, {})
-    mongo_uri = config.get('MONGO_URI')
-    mongo_username = config.get('MONGO_USERNAME')
-    mongo_password = config.get('MONGO_PASSWORD')
-    mongo_db = config.get('MONGO_DB')
-    
-    # Build connection string
-    connection_string = build_mongo_connection_string(
-        uri=mongo_uri,
-        username=mongo_username,
-        password=mongo_password,
-        db_name=mongo_db,
+# Minimum seconds between connectivity checks of the shared client
+_PING_INTERVAL = 30.0
+_last_ping = 0.0
+
+# Databases Beanie has already been initialized against with the shared client
+_BEANIE_INIT: set[str] = set()
+
+
+def _connection_string() -> str:
+    """Build the connection string for the current environment's MongoDB settings."""
+    return build_mongo_connection_string(
+        uri=SETTINGS.uri,
+        username=SETTINGS.username,
+        password=SETTINGS.password,
+        db_name=SETTINGS.db,
         authSource='admin',
         retryWrites='false'
     )
+
+
+@lru_cache(maxsize=1)
+def _get_mongo_client(connection_string: str) -> AsyncMongoClient:
+    """
+    Return the process-wide MongoDB client for a connection string, created on first use.
     
-    client: Optional[AsyncMongoClient] = None
+    FastMCP runs the lifespan per request in stateless HTTP mode, so the client (and its
+    discovered topology and pooled connections) must outlive each lifespan.
+    """
+    return AsyncMongoClient(
+        connection_string,
+        serverSelectionTimeoutMS=5000,
+        connectTimeoutMS=10000,
+        **SETTINGS.client_options
+    )
+
+
+async def close_mongo_client() -> None:
+    """Close the shared MongoDB client and its connection pool on application shutdown."""
+    if _get_mongo_client.cache_info().currsize:
+        client = _get_mongo_client(_connection_string())
+        _get_mongo_client.cache_clear()
+        # A new client needs Beanie bound to it again
+        _BEANIE_INIT.clear()
+        await client.close()
+        logger.info("MongoDB client closed")
+
+
+@asynccontextmanager
+async def app_lifespan(server: FastMCP) -> AsyncIterator[DbContext]:
+    """Manage application lifecycle with MongoDB connection."""
+    global _last_ping
+    mongo_db = SETTINGS.db
     
     try:
-        # Initialize MongoDB client
-        client = AsyncMongoClient(
-            connection_string,
-            serverSelectionTimeoutMS=5000,
-            connectTimeoutMS=10000
-        )
-
-        await initialize_beanie(
-            client=client,
-            db_name=mongo_db,
-            document_models=[Job]
-        )
+        # Reuse the process-wide MongoDB client
+        client = _get_mongo_client(_connection_string())
+
+        # Register the document models once per process and database
+        if mongo_db not in _BEANIE_INIT:
+            await initialize_beanie(
+                client=client,
+                db_name=mongo_db,
+                document_models=[Job]
+            )
+            _BEANIE_INIT.add(mongo_db)
         
-        # Test connection
-        client.admin.command('ping')
-        logger.info(f"MongoDB client connected successfully to database: {mongo_db}")
+        # Test connection when enabled, at most once per ping interval
+        if SETTINGS.verify_startup:
+            now = time.monotonic()
+            if now - _last_ping >= _PING_INTERVAL:
+                # hello is the cheapest round-trip; fail fast rather than wait out server selection
+                await asyncio.wait_for(client.admin.command('hello'), timeout=2.0)
+                _last_ping = now
+                logger.info(f"MongoDB client connected successfully to database: {mongo_db}")
         
-        # Yield database context
+        # Yield database context; the client is closed on application shutdown by
+        # close_mongo_client(), not at the end of each lifespan
         yield DbContext(client=client, db_name=mongo_db)
         
     except ConnectionFailure as e:
@@ -100,13 +174,3 @@ async def app_lifespan(server: FastMCP) -> AsyncIterator[DbContext]:
     except Exception as e:
         logger.error(f"Unexpected error during MongoDB initialization: {str(e)}")
         raise
-    finally:
-        if client is not None:
-            await client.close()
-            logger.info("MongoDB client closed")
-
-
-
-
-
-
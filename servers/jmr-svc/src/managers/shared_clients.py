@@ -0,0 +1,162 @@
+"""Process-wide clients shared by every MCP service lifespan."""
+import asyncio
+import os
+import socket
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
+from utility import logprovider
+from config import config, env
+import httpx
+
+logger = logprovider.get_logger()
+
+# Shared read-only default for missing config sections, instead of a new {} per lookup
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+# Set HTTPX_KEEPALIVE_UNBOUNDED=1 for short-lived processes to keep idle connections for the client's lifetime
+_KEEPALIVE_UNBOUNDED = os.environ.get('HTTPX_KEEPALIVE_UNBOUNDED', '').lower() in ('1', 'true', 'yes')
+
+
+@dataclass(frozen=True, slots=True)
+class HttpxSettings:
+    """HTTPX client settings for the current environment, resolved once at import."""
+    max_connections: int
+    max_keepalive_connections: int
+    keepalive_expiry: Optional[float]
+    http2: bool
+    timeout: float
+    connect_timeout: float
+    follow_redirects: bool
+    verify: bool
+    umr_config: Mapping[str, Any]
+    
+    @classmethod
+    def from_config(cls, env_config: Mapping[str, Any]) -> "HttpxSettings":
+        """
+        Build the settings from an environment config, applying defaults for missing keys.
+        
+        Args:
+            env_config: The environment's configuration mapping
+            
+        Returns:
+            HttpxSettings: The resolved settings
+        """
+        httpx_settings = env_config.get('HTTPX_SETTINGS', _EMPTY)
+        return cls(
+            max_connections=httpx_settings.get('max_connections', 1000),
+            max_keepalive_connections=httpx_settings.get('max_keepalive_connections', 100),
+            keepalive_expiry=None if _KEEPALIVE_UNBOUNDED else httpx_settings.get('keepalive_expiry', 60.0),
+            http2=httpx_settings.get('http2', True),
+            timeout=httpx_settings.get('timeout', 30.0),
+            connect_timeout=httpx_settings.get('connect_timeout', 10.0),
+            follow_redirects=httpx_settings.get('follow_redirects', True),
+            verify=httpx_settings.get('verify', True),
+            umr_config=env_config.get('UMR_SERVICE', _EMPTY)
+        )
+
+
+SETTINGS = HttpxSettings.from_config(config)
+
+# Pool limits and timeouts built once from SETTINGS
+_LIMITS = httpx.Limits(
+    max_connections=SETTINGS.max_connections,
+    max_keepalive_connections=SETTINGS.max_keepalive_connections,
+    keepalive_expiry=SETTINGS.keepalive_expiry
+)
+_TIMEOUT = httpx.Timeout(SETTINGS.timeout, connect=SETTINGS.connect_timeout)
+
+# OS-level TCP keepalive so connections silently dropped by a NAT/load balancer are detected
+# within ~90s instead of stalling the next request; idle/interval/count tuning where supported (Linux)
+_SOCKET_OPTIONS = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+if hasattr(socket, "TCP_KEEPIDLE"):
+    _SOCKET_OPTIONS += [
+        (socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 60),
+        (socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 10),
+        (socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 3),
+    ]
+
+# Process-wide client: FastMCP runs the lifespan per request in stateless HTTP mode,
+# so the pool (and its warm connections) must outlive each lifespan
+_http_client: Optional[httpx.AsyncClient] = None
+_http_client_lock = asyncio.Lock()
+
+
+async def _warm_up(client: httpx.AsyncClient, umr_config: dict) -> None:
+    """
+    Open a pooled connection to the UMR service ahead of the first tool call.
+    
+    Resolves DNS and completes the TCP/TLS (and HTTP/2) handshake with a cheap GET
+    to the health endpoint; failures are logged and otherwise ignored. Logs the
+    negotiated protocol and warns when HTTP/2 was requested but not negotiated
+    (e.g. no ALPN support upstream), since every connection then carries one request.
+    """
+    base_url = umr_config.get('URL')
+    if not base_url:
+        return
+    
+    health_url = f"{base_url}{umr_config.get('HEALTH_PATH', '/health')}"
+    try:
+        response = await client.get(health_url, timeout=2.0)
+        http_version = response.http_version
+        logger.info(f"HTTPX connection pool warmed up against {health_url} over {http_version}")
+        if SETTINGS.http2 and http_version != "HTTP/2":
+            logger.warning(
+                f"HTTP/2 is enabled but {health_url} negotiated {http_version}; "
+                f"requests will not be multiplexed"
+            )
+    except Exception as e:
+        # Best effort: a bad URL or protocol (InvalidURL, UnsupportedProtocol, ValueError) must not stop startup
+        logger.warning(f"HTTPX warm-up request to {health_url} failed: {type(e).__name__}: {str(e)}")
+
+
+async def get_http_client() -> httpx.AsyncClient:
+    """
+    Return the process-wide HTTPX client, creating and warming it up on first use.
+    
+    Every MCP service borrows this one client, so all of them share a single connection
+    pool; it is closed once on application shutdown by close_http_client().
+    
+    Returns:
+        httpx.AsyncClient: The shared client
+    """
+    global _http_client
+    client = _http_client
+    if client is not None:
+        return client
+    
+    async with _http_client_lock:
+        if _http_client is None:
+            # The transport owns the pool, so limits, HTTP/2 and TLS verification are set on it
+            transport = httpx.AsyncHTTPTransport(
+                verify=SETTINGS.verify,
+                http2=SETTINGS.http2,
+                limits=_LIMITS,
+                retries=1,
+                socket_options=_SOCKET_OPTIONS
+            )
+            client = httpx.AsyncClient(
+                transport=transport,
+                timeout=_TIMEOUT,
+                follow_redirects=SETTINGS.follow_redirects
+            )
+            
+            logger.info(
+                f"HTTPX AsyncClient initialized for '{env}' environment - "
+                f"max_connections: {SETTINGS.max_connections}, "
+                f"max_keepalive: {SETTINGS.max_keepalive_connections}, "
+                f"http2: {SETTINGS.http2}"
+            )
+            
+            await _warm_up(client, SETTINGS.umr_config)
+            _http_client = client
+        return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTPX client and its connection pool on application shutdown."""
+    global _http_client
+    if _http_client is not None:
+        client, _http_client = _http_client, None
+        await client.aclose()
+        logger.info("HTTPX AsyncClient closed and connection pool cleaned up")
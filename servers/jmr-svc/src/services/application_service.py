@@ -1,10 +1,8 @@
-from helpers.resource_register import ResourceRegister
 from helpers.tools_register import ToolRegister
 from utility import logprovider
+from common import current_correlation_id
 from mcp.server.fastmcp import FastMCP
 from typing import Optional
-from urllib.parse import quote_plus
-import uuid
 from managers.http_context import http_app_lifespan
 from components.tools.user_application import UserApplicationTool
 
@@ -17,11 +15,12 @@ applications_mcp = FastMCP(name="Application Service",
                  lifespan=http_app_lifespan
                  )
 
-def setup_user_application_server(appsvc: FastMCP, correlation_id: Optional[str] = uuid.uuid4()):
+def setup_user_application_server(appsvc: FastMCP, correlation_id: Optional[str] = None):
     """Register all user application tools with the manager."""
 
+    correlation_id = correlation_id or current_correlation_id.get()
     tool_manager = ToolRegister(appsvc)
-    tool_manager.register_handler("user_application", UserApplicationTool(str(correlation_id)))
+    tool_manager.register_handler("user_application", UserApplicationTool(correlation_id))
     
     logger.info("UMR user application tools and resources registered successfully")
 
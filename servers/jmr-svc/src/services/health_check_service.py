@@ -1,29 +1,47 @@
 from datetime import datetime, timezone
+from typing import Any
+import orjson
 from mcp.server.fastmcp import FastMCP
 from starlette.requests import Request
-from starlette.responses import JSONResponse,PlainTextResponse
+from starlette.responses import PlainTextResponse, Response
 
 health_mcp = FastMCP(name="HealthCheckService",
                      instructions="This MCP provides JMR health check functionalities.",
                      stateless_http=True
                      )
 
+
+class ORJSONResponse(Response):
+    """JSON response rendered with orjson, which serializes datetimes natively."""
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=str)
+
+
+# Liveness response built once; Starlette responses are not mutated when sent, so it is reused
+_OK_RESPONSE = PlainTextResponse("OK")
+
+# Static part of the detailed health payload; each probe copies it and adds the timestamp
+_BASE = {
+    "status": "healthy",
+    "service": "HealthCheckService",
+    "version": "1.0"
+}
+
 @health_mcp.custom_route("/health", methods=["GET"])
 async def health_check(request: Request) -> PlainTextResponse:
-    return PlainTextResponse("OK")
+    return _OK_RESPONSE
 
 @health_mcp.custom_route("/health/detailed", methods=["GET"])
-async def detailed_health_check(request: Request) -> JSONResponse:
+async def detailed_health_check(request: Request) -> ORJSONResponse:
     try:
         # Add any health checks here (database, external services, etc.)
-        return JSONResponse({
-            "status": "healthy",
-            "service": "HealthCheckService",
-            "version": "1.0",
-            "timestamp": datetime.now(timezone.utc).isoformat()
-        })
+        payload = _BASE.copy()
+        payload["timestamp"] = datetime.now(timezone.utc)
+        return ORJSONResponse(payload)
     except Exception as e:
-        return JSONResponse({
+        return ORJSONResponse({
             "status": "unhealthy",
             "error": str(e)
         }, status_code=500) 
\ No newline at end of file
@@ -1,11 +1,9 @@
 from helpers.resource_register import ResourceRegister
 from utility import logprovider
-from pymongo import MongoClient
+from common import current_correlation_id
 from mcp.server.fastmcp import FastMCP
 from typing import Optional
-from urllib.parse import quote_plus
 from helpers.tools_register import ToolRegister
-import uuid
 from managers.mongo_context import app_lifespan
 from components.tools.job_listing import JobListingTool
 from components.resources.job_listing import JobListingResource     
@@ -18,12 +16,13 @@ job_listing_mcp = FastMCP(name="JMRService",
                  stateless_http=True,
                  lifespan=app_lifespan
                  )
-def setup_joblisting_server(jmrsvc: FastMCP, correlation_id: Optional[str] = uuid.uuid4()):
+def setup_joblisting_server(jmrsvc: FastMCP, correlation_id: Optional[str] = None):
     """Register all DB tools with the manager."""
 
+    correlation_id = correlation_id or current_correlation_id.get()
     # joblisting_tool_handler = JobListingTool(str(correlation_id))
     tool_manager = ToolRegister(jmrsvc)
-    tool_manager.register_handler("job_listing", JobListingTool(str(correlation_id)))
+    tool_manager.register_handler("job_listing", JobListingTool(correlation_id))
     resource_manager = ResourceRegister(jmrsvc)
-    resource_manager.register_handler("job_listing", JobListingResource(str(correlation_id)))
+    resource_manager.register_handler("job_listing", JobListingResource(correlation_id))
     logger.info("JMR Database tools and resources registered successfully")
\ No newline at end of file